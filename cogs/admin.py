@@ -1,19 +1,116 @@
+import asyncio
+from collections import Counter
+import functools
 import discord
+import logging
 from discord.ext import commands
-import importlib
 import sys
 from utils.checks import is_admin
+from utils.log import admin_logger as logger
 from utils.menus import EmbedBuilder, LeaderboardBuilder, send_paginated_embed
-import logging
+from typing import Optional, Tuple
+
+# Discord's limit on embed description length
+MAX_EMBED_DESC = 4096
+
+# Seconds reload_all waits before posting a progress message
+PROGRESS_MESSAGE_DELAY = 0.5
+
+# Prefix for each line of the reload result lists
+_BULLET = "• "
+
+# Static parts of the list_cogs embed; title, description and timestamp are
+# filled in per call
+_LIST_COGS_TEMPLATE = {"type": "rich", "color": discord.Color.blue().value}
+
+# Sample data for the demo leaderboard, built once at import
+_SAMPLE_LEADERBOARD = tuple(
+    {"name": name, "score": score, "emoji": emoji}
+    for name, score, emoji in (
+        ("Alice", 9847, "👑"),
+        ("Bob", 8932, "⚔️"),
+        ("Charlie", 7651, "🏹"),
+        ("Diana", 7203, "🛡️"),
+        ("Eve", 6789, "✨"),
+        ("Frank", 6234, "🔥"),
+        ("Grace", 5987, "❄️"),
+        ("Henry", 5543, "⚡"),
+        ("Ivy", 5012, "🌟"),
+        ("Jack", 4876, "🎯"),
+        ("Kate", 4234, "💎"),
+        ("Liam", 3987, "🏆"),
+        ("Maya", 3654, "🎪"),
+        ("Noah", 3321, "🎨"),
+        ("Olivia", 2998, "🎭"),
+        ("Peter", 2765, "🎪"),
+        ("Quinn", 2432, "🎵"),
+        ("Ruby", 2198, "💫"),
+        ("Sam", 1987, "🌙"),
+        ("Tina", 1765, "☀️"),
+        ("Uma", 1543, "🌈"),
+        ("Victor", 1321, "🦋"),
+        ("Wendy", 1098, "🌸"),
+        ("Xavier", 876, "🍀"),
+        ("Yara", 654, "🎀"),
+    )
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _demo_leaderboard_embeds() -> Tuple[discord.Embed, ...]:
+    """Build the demo leaderboard pages once; callers must copy before sending"""
+    return tuple(
+        LeaderboardBuilder.create_leaderboard(
+            title="🏆 Demo Leaderboard",
+            entries=_SAMPLE_LEADERBOARD,
+            page_size=10,
+            key_field="name",
+            value_field="score",
+            emoji_field="emoji",
+            color=discord.Color.gold(),
+            thumbnail="https://cdn.discordapp.com/emojis/1234567890.png",  # Optional
+        )
+    )
+
+
+def _bullet_list(items) -> str:
+    """Format items as one bulleted line each"""
+    return "\n".join(_BULLET + item for item in items)
 
-logger = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=128)
+def _module_path(cog_name: str) -> str:
+    """Normalize a cog name to its interned extension module path"""
+    if cog_name.startswith("cogs."):
+        return sys.intern(cog_name)
+    return sys.intern(f"cogs.{cog_name.lower()}")
 
 
 class Admin(commands.Cog):
     """Administrative commands for bot management"""
 
+    # commands.Cog itself has no __slots__, so instances keep a __dict__ for the
+    # attributes discord.py sets; this only moves our own attribute into a slot
+    __slots__ = ("bot", "_bg_tasks", "_cmd_counts")
+
     def __init__(self, bot):
         self.bot = bot
+        # Strong references to fire-and-forget tasks so they aren't collected
+        # mid-flight
+        self._bg_tasks = set()
+        # Visible command counts per cog for list_cogs, built on first use
+        self._cmd_counts: Optional[Counter] = None
+
+    @commands.Cog.listener()
+    async def on_extensions_changed(self):
+        """Drop cached command counts when cogs are loaded, unloaded or reloaded"""
+        self._cmd_counts = None
+
+    def _on_bg_task_done(self, task: asyncio.Task):
+        """Drop the task reference and report any exception it raised"""
+        self._bg_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("log_action failed: %s", task.exception())
 
     @commands.hybrid_group(name="reload", aliases=["r"])
     @is_admin()
@@ -26,53 +123,87 @@ class Admin(commands.Cog):
     @is_admin()
     async def reload_all(self, ctx):
         """Reload all cogs"""
-        embed = EmbedBuilder.create_embed(
-            title="🔄 Reloading All Cogs",
-            description="Attempting to reload all loaded cogs...",
-            color=discord.Color.orange(),
-        )
-        message = await ctx.send(embed=embed)
-
         success_cogs = []
         failed_cogs = []
 
-        # Get list of currently loaded cogs
-        cog_names = list(self.bot.cogs.keys())
+        # Snapshot the loaded extensions; reloading mutates bot.extensions
+        module_names = tuple(self.bot.extensions)
+
+        # Reload every cog concurrently; exceptions are returned in place so one
+        # broken cog doesn't abort the rest of the batch
+        reloads = asyncio.ensure_future(
+            asyncio.gather(
+                *(self.bot.reload_extension(name) for name in module_names),
+                return_exceptions=True,
+            )
+        )
 
-        for cog_name in cog_names:
-            try:
-                # Convert cog name to module path
-                module_name = f"cogs.{cog_name.lower()}"
-                await self.bot.reload_extension(module_name)
-                success_cogs.append(cog_name)
-                logger.info("Reloaded %s", module_name)
-            except Exception as e:
-                failed_cogs.append(f"{cog_name}: {str(e)}")
-                logger.error("Failed to reload %s: %s", cog_name, e)
+        # Fast reloads get a single result message; only post a progress
+        # message (and edit it later) when the batch is still running
+        message = None
+        try:
+            results = await asyncio.wait_for(
+                asyncio.shield(reloads), PROGRESS_MESSAGE_DELAY
+            )
+        except asyncio.TimeoutError:
+            embed = EmbedBuilder.create_embed(
+                title="🔄 Reloading All Cogs",
+                description="Attempting to reload all loaded cogs...",
+                color=discord.Color.orange(),
+            )
+            message = await ctx.send(embed=embed)
+            results = await reloads
+
+        # Check the log levels once rather than on every iteration
+        info_on = logger.isEnabledFor(logging.INFO)
+        error_on = logger.isEnabledFor(logging.ERROR)
+
+        for module_name, result in zip(module_names, results):
+            if isinstance(result, BaseException):
+                err_text = str(result)
+                failed_cogs.append(f"{module_name}: {err_text}")
+                if error_on:
+                    logger.error("Failed to reload %s: %s", module_name, err_text)
+            else:
+                success_cogs.append(module_name)
+                if info_on:
+                    logger.info("Reloaded %s", module_name)
 
         # Update embed with results
         if success_cogs and not failed_cogs:
+            parts = (
+                f"Successfully reloaded {len(success_cogs)} cogs:",
+                _bullet_list(success_cogs),
+            )
             embed = EmbedBuilder.create_success_embed(
                 title="✅ All Cogs Reloaded",
-                description=f"Successfully reloaded {len(success_cogs)} cogs:\n"
-                + "\n".join(f"• {cog}" for cog in success_cogs),
+                description="\n".join(parts)[:MAX_EMBED_DESC],
             )
         elif success_cogs and failed_cogs:
+            parts = (
+                f"**Successful ({len(success_cogs)}):**",
+                _bullet_list(success_cogs),
+                f"\n**Failed ({len(failed_cogs)}):**",
+                _bullet_list(failed_cogs[:5]),
+            )
             embed = EmbedBuilder.create_warning_embed(
                 title="⚠️ Partial Reload Success",
-                description=f"**Successful ({len(success_cogs)}):**\n"
-                + "\n".join(f"• {cog}" for cog in success_cogs)
-                + f"\n\n**Failed ({len(failed_cogs)}):**\n"
-                + "\n".join(f"• {cog}" for cog in failed_cogs[:5]),
+                description="\n".join(parts)[:MAX_EMBED_DESC],
             )
         else:
+            parts = ("Failed to reload all cogs:", _bullet_list(failed_cogs[:5]))
             embed = EmbedBuilder.create_error_embed(
                 title="❌ Reload Failed",
-                description="Failed to reload all cogs:\n"
-                + "\n".join(f"• {cog}" for cog in failed_cogs[:5]),
+                description="\n".join(parts)[:MAX_EMBED_DESC],
             )
 
-        await message.edit(embed=embed)
+        if success_cogs:
+            self.bot.dispatch("extensions_changed")
+
+        if message is None:
+            await ctx.send(embed=embed)
+        else:
+            await self.bot.outbox.edit(message, embed=embed)
 
     @reload_commands.command()
     @is_admin()
@@ -86,8 +217,9 @@ class Admin(commands.Cog):
             The name of the cog to reload
         """
         try:
-            module_name = f"cogs.{cog_name.lower()}"
+            module_name = _module_path(cog_name)
             await self.bot.reload_extension(module_name)
+            self.bot.dispatch("extensions_changed")
 
             embed = EmbedBuilder.create_success_embed(
                 title="✅ Cog Reloaded",
@@ -96,12 +228,13 @@ class Admin(commands.Cog):
             await ctx.send(embed=embed)
             logger.info("Reloaded %s", module_name)
         except Exception as e:
+            err_text = str(e)
             embed = EmbedBuilder.create_error_embed(
                 title="❌ Reload Failed",
-                description=f"Failed to reload `{cog_name}`: {str(e)}",
+                description=f"Failed to reload `{cog_name}`: {err_text}",
             )
             await ctx.send(embed=embed)
-            logger.error("Failed to reload %s: %s", cog_name, e)
+            logger.error("Failed to reload %s: %s", cog_name, err_text)
 
     @commands.hybrid_command(name="load")
     @is_admin()
@@ -115,8 +248,9 @@ class Admin(commands.Cog):
             The name of the cog to load
         """
         try:
-            module_name = f"cogs.{cog_name.lower()}"
+            module_name = _module_path(cog_name)
             await self.bot.load_extension(module_name)
+            self.bot.dispatch("extensions_changed")
 
             embed = EmbedBuilder.create_success_embed(
                 title="✅ Cog Loaded", description=f"Successfully loaded `{cog_name}`"
@@ -124,12 +258,13 @@ class Admin(commands.Cog):
             await ctx.send(embed=embed)
             logger.info("Loaded %s", module_name)
         except Exception as e:
+            err_text = str(e)
             embed = EmbedBuilder.create_error_embed(
                 title="❌ Load Failed",
-                description=f"Failed to load `{cog_name}`: {str(e)}",
+                description=f"Failed to load `{cog_name}`: {err_text}",
             )
             await ctx.send(embed=embed)
-            logger.error("Failed to load %s: %s", cog_name, e)
+            logger.error("Failed to load %s: %s", cog_name, err_text)
 
     @commands.hybrid_command(name="unload")
     @is_admin()
@@ -143,8 +278,9 @@ class Admin(commands.Cog):
             The name of the cog to unload
         """
         try:
-            module_name = f"cogs.{cog_name.lower()}"
+            module_name = _module_path(cog_name)
             await self.bot.unload_extension(module_name)
+            self.bot.dispatch("extensions_changed")
 
             embed = EmbedBuilder.create_success_embed(
                 title="✅ Cog Unloaded",
@@ -153,12 +289,13 @@ class Admin(commands.Cog):
             await ctx.send(embed=embed)
             logger.info("Unloaded %s", module_name)
         except Exception as e:
+            err_text = str(e)
             embed = EmbedBuilder.create_error_embed(
                 title="❌ Unload Failed",
-                description=f"Failed to unload `{cog_name}`: {str(e)}",
+                description=f"Failed to unload `{cog_name}`: {err_text}",
             )
             await ctx.send(embed=embed)
-            logger.error("Failed to unload %s: %s", cog_name, e)
+            logger.error("Failed to unload %s: %s", cog_name, err_text)
 
     @commands.hybrid_command(name="cogs")
     @is_admin()
@@ -170,25 +307,49 @@ class Admin(commands.Cog):
                 description="There are currently no cogs loaded.",
             )
         else:
-            cog_list = []
-            for cog_name, cog in self.bot.cogs.items():
-                command_count = len(
-                    [cmd for cmd in cog.get_commands() if not cmd.hidden]
+            # Count visible top-level commands per cog in a single pass; the
+            # counts only change when extensions do, so keep them until then
+            counts = self._cmd_counts
+            if counts is None:
+                counts = self._cmd_counts = Counter(
+                    cmd.cog_name for cmd in self.bot.commands if not cmd.hidden
                 )
-                cog_list.append(f"• **{cog_name}** - {command_count} commands")
-
-            embed = EmbedBuilder.create_info_embed(
-                title=f"📦 Loaded Cogs ({len(self.bot.cogs)})",
-                description="\n".join(cog_list),
+            cog_list = "\n".join(
+                f"• **{cog_name}** - {counts[cog_name]} commands"
+                for cog_name in self.bot.cogs
             )
 
+            # Same styling as EmbedBuilder.create_info_embed, built from a dict
+            data = dict(_LIST_COGS_TEMPLATE)
+            data["title"] = f"ℹ️ 📦 Loaded Cogs ({len(self.bot.cogs)})"
+            data["description"] = cog_list
+            data["timestamp"] = discord.utils.utcnow().isoformat()
+            embed = discord.Embed.from_dict(data)
+
         await ctx.send(embed=embed)
 
     @commands.hybrid_command(name="sync")
     @is_admin()
-    async def sync_commands(self, ctx):
-        """Sync application commands"""
+    async def sync_commands(self, ctx, force: bool = False):
+        """
+        Sync application commands
+
+        Parameters
+        ----------
+        force : bool
+            Sync even if the commands haven't changed since the last sync
+        """
         try:
+            tree_hash = self.bot.command_tree_hash()
+            if not force and tree_hash == self.bot.synced_tree_hash:
+                embed = EmbedBuilder.create_info_embed(
+                    title="No Changes",
+                    description="Application commands are already up to date "
+                    "— skipped sync.",
+                )
+                await ctx.send(embed=embed)
+                return
+
             embed = EmbedBuilder.create_embed(
                 title="�� Syncing Commands",
                 description="Syncing application commands with Discord...",
@@ -197,19 +358,22 @@ class Admin(commands.Cog):
             message = await ctx.send(embed=embed)
 
             synced = await self.bot.tree.sync()
+            self.bot.synced_tree_hash = tree_hash
 
             embed = EmbedBuilder.create_success_embed(
                 title="✅ Commands Synced",
                 description=f"Successfully synced {len(synced)} application commands.",
             )
-            await message.edit(embed=embed)
+            await self.bot.outbox.edit(message, embed=embed)
             logger.info("Synced %d application commands", len(synced))
         except Exception as e:
+            err_text = str(e)
             embed = EmbedBuilder.create_error_embed(
-                title="❌ Sync Failed", description=f"Failed to sync commands: {str(e)}"
+                title="❌ Sync Failed",
+                description=f"Failed to sync commands: {err_text}",
             )
             await ctx.send(embed=embed)
-            logger.error("Failed to sync commands: %s", e)
+            logger.error("Failed to sync commands: %s", err_text)
 
     @commands.hybrid_command(name="shutdown", aliases=["stop", "quit"])
     @is_admin()
@@ -226,58 +390,33 @@ class Admin(commands.Cog):
     @is_admin()
     async def demo_leaderboard(self, ctx):
         """Demo leaderboard command showcasing the menu system"""
-        # Create sample leaderboard data
-        sample_data = [
-            {"name": "Alice", "score": 9847, "emoji": "👑"},
-            {"name": "Bob", "score": 8932, "emoji": "⚔️"},
-            {"name": "Charlie", "score": 7651, "emoji": "🏹"},
-            {"name": "Diana", "score": 7203, "emoji": "🛡️"},
-            {"name": "Eve", "score": 6789, "emoji": "✨"},
-            {"name": "Frank", "score": 6234, "emoji": "🔥"},
-            {"name": "Grace", "score": 5987, "emoji": "❄️"},
-            {"name": "Henry", "score": 5543, "emoji": "⚡"},
-            {"name": "Ivy", "score": 5012, "emoji": "🌟"},
-            {"name": "Jack", "score": 4876, "emoji": "🎯"},
-            {"name": "Kate", "score": 4234, "emoji": "💎"},
-            {"name": "Liam", "score": 3987, "emoji": "🏆"},
-            {"name": "Maya", "score": 3654, "emoji": "🎪"},
-            {"name": "Noah", "score": 3321, "emoji": "🎨"},
-            {"name": "Olivia", "score": 2998, "emoji": "🎭"},
-            {"name": "Peter", "score": 2765, "emoji": "🎪"},
-            {"name": "Quinn", "score": 2432, "emoji": "🎵"},
-            {"name": "Ruby", "score": 2198, "emoji": "💫"},
-            {"name": "Sam", "score": 1987, "emoji": "🌙"},
-            {"name": "Tina", "score": 1765, "emoji": "☀️"},
-            {"name": "Uma", "score": 1543, "emoji": "🌈"},
-            {"name": "Victor", "score": 1321, "emoji": "🦋"},
-            {"name": "Wendy", "score": 1098, "emoji": "🌸"},
-            {"name": "Xavier", "score": 876, "emoji": "🍀"},
-            {"name": "Yara", "score": 654, "emoji": "🎀"},
-        ]
-
-        # Create leaderboard embeds
-        embeds = LeaderboardBuilder.create_leaderboard(
-            title="🏆 Demo Leaderboard",
-            entries=sample_data,
-            page_size=10,
-            key_field="name",
-            value_field="score",
-            emoji_field="emoji",
-            color=discord.Color.gold(),
-            thumbnail="https://cdn.discordapp.com/emojis/1234567890.png",  # Optional
-        )
+        # Copy the prebuilt pages; the paginator rewrites their footers
+        now = discord.utils.utcnow()
+        embeds = []
+        for page in _demo_leaderboard_embeds():
+            embed = page.copy()
+            embed.timestamp = now
+            embeds.append(embed)
 
         # Send paginated leaderboard
         await send_paginated_embed(ctx, embeds, user=ctx.author)
 
-        # Log the action if database is available
+        # Log the action in the background if database is available; the reply
+        # has already been sent, so there's no reason to wait on the write
         if self.bot.db:
-            await self.bot.db.log_action(
-                guild_id=ctx.guild.id if ctx.guild else 0,
-                user_id=ctx.author.id,
-                action="demo_leaderboard_viewed",
-                details={"command": "leaderboard", "entries": len(sample_data)},
+            task = asyncio.create_task(
+                self.bot.db.log_action(
+                    guild_id=ctx.guild.id if ctx.guild else 0,
+                    user_id=ctx.author.id,
+                    action="demo_leaderboard_viewed",
+                    details={
+                        "command": "leaderboard",
+                        "entries": len(_SAMPLE_LEADERBOARD),
+                    },
+                )
             )
+            self._bg_tasks.add(task)
+            task.add_done_callback(self._on_bg_task_done)
 
     # Error handling
     @reload_commands.error
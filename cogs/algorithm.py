@@ -1,3 +1,4 @@
+import asyncio
 import discord
 from discord.ext import commands
 from utils.checks import is_admin
@@ -19,30 +20,44 @@ class Algorithm(commands.Cog):
 
     @commands.command(name="getSmashStats")
     async def getSmashStats(self, ctx, id):
-        print("change made 23 dguioahfguahufghau")
+        logger.debug("getSmashStats invoked id=%s", id)
         mango = SSBUPlayer.SSBUPlayer(id, self.startggKey, self.bot.session)
+        # fetch_data seeds the player state the other requests build on
         await mango.fetch_data()
-        await mango.fetch_rankings()
-        await mango.fetch_standings()
-        await mango.fetch_sets()
-        await mango.fetch_mains()
-        await mango.fetch_extreme_matchups()
-        await mango.fetch_extreme_stages()
-        await mango.fetch_win_rates()
+        # These are independent start.gg queries, so overlap the round trips
+        await asyncio.gather(
+            mango.fetch_rankings(),
+            mango.fetch_standings(),
+            mango.fetch_sets(),
+            mango.fetch_mains(),
+        )
+        # Matchup, stage and win-rate breakdowns are derived from the sets
+        await asyncio.gather(
+            mango.fetch_extreme_matchups(),
+            mango.fetch_extreme_stages(),
+            mango.fetch_win_rates(),
+        )
         x = await mango.get_stats()
         await ctx.send(x)
 
     @commands.command(name="getRLStats")
     async def getRLStats(self, ctx, platform, id):
         player = RocketLeaguePlayer.RocketLeaguePlayer(platform, id, self.ballchasingKey, self.bot.session)
+        # Both the stats and main car lookups work off the replay list
         await player.fetch_replay_list()
-        await player.fetch2v2stats()
+        await asyncio.gather(player.fetch2v2stats(), player.fetch_main_car())
+        # Categorization uses the 2v2 stats
         await player.categorize_player()
-        await player.fetch_main_car()
         x = await player.get_stats("ranked-doubles")
         y = await player.get_car()
-        await ctx.send(x)
-        await ctx.send(y)
+        # One message instead of two, unless together they'd exceed Discord's
+        # 2000 character limit
+        combined = f"{x}\n{y}"
+        if len(combined) <= 2000:
+            await ctx.send(combined)
+        else:
+            await ctx.send(x)
+            await ctx.send(y)
     
 
 
@@ -7,16 +7,21 @@ and social interactions.
 """
 
 import asyncio
+import bisect
+import copy
+import itertools
 import logging
 import os
 import random
-from datetime import datetime, timedelta
-from typing import Dict, Any
+import time
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
 
 import discord
 from discord.ext import commands
 
 from utils.menus import EmbedBuilder, send_paginated_embed
+from utils.cache import TTLCache
 from utils.database import get_db, SQLiteManager
 
 logger = logging.getLogger(__name__)
@@ -24,6 +29,16 @@ logger = logging.getLogger(__name__)
 # EVAL characters for slots
 EVAL_CHARACTERS = ["🔥", "⚡", "💎", "🌟", "👑", "🎯", "🚀", "💀", "🌙", "☄️"]
 
+# Coin faces indexed by a single random bit
+_COIN_SIDES = ("heads", "tails")
+
+# Slot payouts for three of a kind; other triples pay 5x
+_TRIPLE_MULT = {
+    "💎": 50,  # Diamond jackpot
+    "👑": 25,  # Crown mega win
+    "🔥": 10,  # Fire big win
+}
+
 # Aura titles based on aura amount
 AURA_TITLES = {
     1000000: "Aura God",
@@ -45,7 +60,19 @@ AURA_TITLES = {
     -25000: "Aura Banished",
 }
 
+# Title thresholds in ascending order, with titles in matching positions, for
+# bisect lookups in get_aura_title
+_AURA_THRESHOLDS_ASC = sorted(AURA_TITLES)
+_AURA_TITLES_ASC = [AURA_TITLES[threshold] for threshold in _AURA_THRESHOLDS_ASC]
+
+# Number of top users shown on the aura leaderboard
+LEADERBOARD_SIZE = 20
+# Rows fetched for the leaderboard; the spare rows fill in for users who
+# have left the guild
+LEADERBOARD_FETCH_SIZE = LEADERBOARD_SIZE * 2
+
 # Daily rewards
+DAILY_COOLDOWN = 20 * 3600  # seconds between daily claims
 DAILY_MESSAGES = [
     "✨ The universe smiles upon you!",
     "🌟 Your aura radiates with cosmic energy!",
@@ -59,6 +86,16 @@ DAILY_MESSAGES = [
     "🎯 Bullseye! Cosmic accuracy achieved!",
 ]
 
+# Daily bonus events as (chance, bonus, message). The chances are exclusive:
+# at most one event fires, with exactly the listed probability
+DAILY_BONUS_EVENTS = [
+    (0.05, 500, "🌟 COSMIC ALIGNMENT! Bonus aura rain!"),
+    (0.1, 200, "⚡ Lightning struck your aura!"),
+    (0.15, 100, "🎪 The cosmic carnival visited you!"),
+]
+_DAILY_BONUS_CUM = list(itertools.accumulate(c for c, _, _ in DAILY_BONUS_EVENTS))
+_DAILY_BONUS_VALUES = [bonus for _, bonus, _ in DAILY_BONUS_EVENTS]
+
 # Shop items
 AURA_SHOP = {
     "shield": {
@@ -81,6 +118,60 @@ AURA_SHOP = {
     },
 }
 
+# Rendered once at import; titles and shop items never change at runtime.
+# Ascension titles are listed highest first, descent titles lowest first
+_POS_TITLES_SORTED = tuple(
+    sorted(((k, v) for k, v in AURA_TITLES.items() if k >= 0), reverse=True)
+)
+_NEG_TITLES_SORTED = tuple(sorted((k, v) for k, v in AURA_TITLES.items() if k < 0))
+_POS_TITLES_TEXT = "".join(f"**{req:,} ✨** - {t}\n" for req, t in _POS_TITLES_SORTED)
+_NEG_TITLES_TEXT = "".join(f"**{req:,} ✨** - {t}\n" for req, t in _NEG_TITLES_SORTED)
+
+# Shop listing fields as (name, value)
+_SHOP_FIELDS = tuple(
+    (f"{item['name']} - {item['cost']:,} ✨", item["description"])
+    for item in AURA_SHOP.values()
+)
+
+
+# Profile embed colours as (minimum aura, colour), highest tier first;
+# anything below the last tier is red
+_COLOR_GOLD = discord.Color.gold()
+_COLOR_PURPLE = discord.Color.purple()
+_COLOR_BLUE = discord.Color.blue()
+_COLOR_GREEN = discord.Color.green()
+_COLOR_RED = discord.Color.red()
+_TIER_COLORS = (
+    (100000, _COLOR_GOLD),
+    (10000, _COLOR_PURPLE),
+    (1000, _COLOR_BLUE),
+    (0, _COLOR_GREEN),
+)
+
+
+def default_aura_data() -> Dict[str, Any]:
+    """Starting aura profile for users without one"""
+    return {
+        "amount": 100,
+        "daily_last": None,
+        "shield_expires": None,
+        "multiplier_expires": None,
+        "items": [],
+        "cooldowns": {},
+        "stats": {
+            "duels_won": 0,
+            "duels_lost": 0,
+            "total_gained": 0,
+            "total_lost": 0,
+            "biggest_win": 0,
+            "biggest_loss": 0,
+        },
+    }
+
+
+class _InsufficientAura(Exception):
+    """Raised inside a purchase to roll back when the user can't afford it"""
+
 
 class Aura(commands.Cog):
     """Aura system - The ultimate power measurement"""
@@ -88,94 +179,200 @@ class Aura(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.duel_requests = {}
+        # Decoded aura data per (user_id, guild_id); the TTL bounds staleness
+        # from writes made outside this cog
+        self._aura_cache = TTLCache(maxsize=10_000, ttl=60)
+        # Static listings, built once and copied per send
+        self._shop_embed = self._build_shop_embed()
+        self._titles_embed = self._build_titles_embed()
+        # Resolved on first use by the db property
+        self._db = None
+
+    @property
+    def db(self):
+        """The bot's database manager, looked up once and then reused"""
+        if self._db is None:
+            self._db = get_db(self.bot)
+        return self._db
 
     async def get_user_aura_data(
         self, user_id: int, guild_id: int = None
     ) -> Dict[str, Any]:
         """Get user's aura data from database"""
-        db = get_db(self.bot)
-        data = await db.get_user_data(user_id, guild_id)
-
-        if "aura" not in data:
-            data["aura"] = {
-                "amount": 100,
-                "daily_last": None,
-                "shield_expires": None,
-                "multiplier_expires": None,
-                "items": [],
-                "cooldowns": {},
-                "stats": {
-                    "duels_won": 0,
-                    "duels_lost": 0,
-                    "total_gained": 0,
-                    "total_lost": 0,
-                    "biggest_win": 0,
-                    "biggest_loss": 0,
-                },
-            }
+        key = (user_id, guild_id)
+        aura_data = self._aura_cache.get(key)
+        if aura_data is None:
+            db = self.db
+            data = await db.get_user_data(user_id, guild_id)
+
+            if "aura" not in data:
+                data["aura"] = default_aura_data()
 
-        return data["aura"]
+            aura_data = data["aura"]
+            self._aura_cache.set(key, aura_data)
+
+        # Callers mutate the result, so never hand out the cached dict itself
+        return copy.deepcopy(aura_data)
 
     async def update_user_aura_data(
         self, user_id: int, aura_data: Dict[str, Any], guild_id: int = None
     ):
         """Update user's aura data in database"""
-        db = get_db(self.bot)
-        user_data = await db.get_user_data(user_id, guild_id)
-        user_data["aura"] = aura_data
-        await db.set_user_data(user_id, user_data, guild_id)
+
+        # Store a copy; the written dict also becomes the cached one
+        def replace_aura(user_data: Dict[str, Any]):
+            user_data["aura"] = copy.deepcopy(aura_data)
+
+        await self._modify_user_data([(user_id, replace_aura)], guild_id)
 
     async def modify_aura(
         self, user_id: int, amount: int, guild_id: int = None, reason: str = None
     ) -> int:
         """Modify user's aura amount and return new total"""
-        aura_data = await self.get_user_aura_data(user_id, guild_id)
+        (new_total,) = await self.modify_auras([(user_id, amount, reason)], guild_id)
+        return new_total
+
+    async def modify_auras(
+        self, changes: List[Tuple[int, int, str]], guild_id: int = None
+    ) -> List[int]:
+        """
+        Apply several (user_id, amount, reason) aura changes in one database
+        transaction and return the new totals in the same order
+        """
+        results = await self._modify_user_data(
+            [
+                (user_id, self._aura_change_mutator(amount, reason))
+                for user_id, amount, reason in changes
+            ],
+            guild_id,
+        )
+        return [user_data["aura"]["amount"] for user_data in results]
+
+    async def _modify_user_data(
+        self, updates: List[Tuple[int, Any]], guild_id: int = None
+    ) -> List[Dict[str, Any]]:
+        """Run user data mutators in one transaction and refresh the cache"""
+        db = self.db
+        results = await db.modify_users_data(updates, guild_id)
+
+        # Write-through: the database has committed, so refresh the cache
+        for (user_id, _), user_data in zip(updates, results):
+            self._aura_cache.set((user_id, guild_id), user_data["aura"])
+
+        return results
+
+    async def purchase_item(
+        self, user_id: int, guild_id: int, item_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Charge a user for a shop item and apply its effect in one transaction
+
+        The balance is checked inside the transaction, so it can't change
+        between the check and the debit. Returns the updated aura data, or
+        None if the user can't afford the item.
+        """
+        item_data = AURA_SHOP[item_id]
+        cost = item_data["cost"]
+        charge = self._aura_change_mutator(-cost, f"shop_purchase_{item_id}")
+
+        def purchase(user_data: Dict[str, Any]):
+            aura_data = user_data.setdefault("aura", default_aura_data())
+            if aura_data["amount"] < cost:
+                raise _InsufficientAura()
+
+            log_entry = charge(user_data)
 
-        # Apply multiplier if active
-        if (
-            aura_data.get("multiplier_expires")
-            and datetime.now().timestamp() < aura_data["multiplier_expires"]
-        ):
-            if amount > 0:
-                amount *= 2
+            # Apply item effects
+            now = time.time()
+            if item_id == "shield":
+                aura_data["shield_expires"] = now + item_data["duration"]
+            elif item_id == "multiplier":
+                aura_data["multiplier_expires"] = now + item_data["duration"]
+            elif item_id in ["bomb"]:
+                aura_data.setdefault("items", []).append(item_id)
 
-        old_amount = aura_data["amount"]
-        aura_data["amount"] += amount
+            return log_entry
 
-        # Update stats
-        if amount > 0:
-            aura_data["stats"]["total_gained"] += amount
-            if amount > aura_data["stats"]["biggest_win"]:
-                aura_data["stats"]["biggest_win"] = amount
-        else:
-            aura_data["stats"]["total_lost"] += abs(amount)
-            if abs(amount) > aura_data["stats"]["biggest_loss"]:
-                aura_data["stats"]["biggest_loss"] = abs(amount)
+        try:
+            (user_data,) = await self._modify_user_data([(user_id, purchase)], guild_id)
+        except _InsufficientAura:
+            return None
+        return user_data["aura"]
+
+    @staticmethod
+    def _aura_change_mutator(amount: int, reason: str = None):
+        """Build a mutator that applies an aura change to a user's data"""
+
+        def mutate(user_data: Dict[str, Any]):
+            aura_data = user_data.setdefault("aura", default_aura_data())
+            change = amount
+
+            # Apply multiplier if active
+            if (
+                aura_data.get("multiplier_expires")
+                and time.time() < aura_data["multiplier_expires"]
+            ):
+                if change > 0:
+                    change *= 2
+
+            old_amount = aura_data["amount"]
+            aura_data["amount"] += change
+
+            # Update stats
+            if change > 0:
+                aura_data["stats"]["total_gained"] += change
+                if change > aura_data["stats"]["biggest_win"]:
+                    aura_data["stats"]["biggest_win"] = change
+            else:
+                aura_data["stats"]["total_lost"] += abs(change)
+                if abs(change) > aura_data["stats"]["biggest_loss"]:
+                    aura_data["stats"]["biggest_loss"] = abs(change)
+
+            return (
+                "aura_change",
+                {
+                    "old_amount": old_amount,
+                    "new_amount": aura_data["amount"],
+                    "change": change,
+                    "reason": reason or "Unknown",
+                },
+            )
 
-        await self.update_user_aura_data(user_id, aura_data, guild_id)
+        return mutate
 
-        # Log the action
-        db = get_db(self.bot)
-        await db.log_action(
-            guild_id,
-            user_id,
-            "aura_change",
-            {
-                "old_amount": old_amount,
-                "new_amount": aura_data["amount"],
-                "change": amount,
-                "reason": reason or "Unknown",
-            },
+    @staticmethod
+    def _build_shop_embed() -> discord.Embed:
+        """Build the shop listing embed"""
+        embed = discord.Embed(
+            title="🏪 Aura Shop",
+            description="Purchase powerful items with your aura!",
+            color=discord.Color.blue(),
+        )
+
+        for name, value in _SHOP_FIELDS:
+            embed.add_field(name=name, value=value, inline=False)
+
+        embed.set_footer(text="Use `/aura shop <item>` to purchase!")
+        return embed
+
+    @staticmethod
+    def _build_titles_embed() -> discord.Embed:
+        """Build the embed listing every aura title"""
+        embed = discord.Embed(
+            title="👑 Aura Titles",
+            description="Achieve these aura amounts to unlock titles!",
+            color=discord.Color.purple(),
         )
 
-        return aura_data["amount"]
+        embed.add_field(name="✨ Ascension Titles", value=_POS_TITLES_TEXT, inline=True)
+        embed.add_field(name="💀 Descent Titles", value=_NEG_TITLES_TEXT, inline=True)
+        return embed
 
     def get_aura_title(self, amount: int) -> str:
         """Get title based on aura amount"""
-        for threshold in sorted(AURA_TITLES.keys(), reverse=True):
-            if amount >= threshold:
-                return AURA_TITLES[threshold]
-        return "Aura Banished"
+        # Index of the highest threshold that the amount reaches
+        idx = bisect.bisect_right(_AURA_THRESHOLDS_ASC, amount) - 1
+        return _AURA_TITLES_ASC[idx] if idx >= 0 else "Aura Banished"
 
     def create_aura_embed(
         self, user: discord.Member, aura_data: Dict[str, Any]
@@ -185,16 +382,11 @@ class Aura(commands.Cog):
         title = self.get_aura_title(amount)
 
         # Color based on aura amount
-        if amount >= 100000:
-            color = discord.Color.gold()
-        elif amount >= 10000:
-            color = discord.Color.purple()
-        elif amount >= 1000:
-            color = discord.Color.blue()
-        elif amount >= 0:
-            color = discord.Color.green()
-        else:
-            color = discord.Color.red()
+        color = _COLOR_RED
+        for threshold, tier_color in _TIER_COLORS:
+            if amount >= threshold:
+                color = tier_color
+                break
 
         embed = discord.Embed(title=f"✨ {user.display_name}'s Aura", color=color)
 
@@ -206,7 +398,7 @@ class Aura(commands.Cog):
 
         # Active effects
         effects = []
-        now = datetime.now().timestamp()
+        now = time.time()
 
         if aura_data.get("shield_expires") and now < aura_data["shield_expires"]:
             remaining = int(aura_data["shield_expires"] - now)
@@ -275,23 +467,17 @@ class Aura(commands.Cog):
             return
 
         # Generate slots
-        slots = [random.choice(EVAL_CHARACTERS) for _ in range(3)]
-
-        # Calculate winnings
-        multiplier = 0
-        if slots[0] == slots[1] == slots[2]:  # Triple match
-            if slots[0] == "💎":  # Diamond jackpot
-                multiplier = 50
-            elif slots[0] == "👑":  # Crown mega win
-                multiplier = 25
-            elif slots[0] == "🔥":  # Fire big win
-                multiplier = 10
-            else:  # Other triples
-                multiplier = 5
-        elif (
-            slots[0] == slots[1] or slots[1] == slots[2] or slots[0] == slots[2]
-        ):  # Double match
+        slots = random.choices(EVAL_CHARACTERS, k=3)
+
+        # Calculate winnings: 3 equal pairs is a triple, 1 is a double
+        a, b, c = slots
+        matches = (a == b) + (b == c) + (a == c)
+        if matches == 3:  # Triple match
+            multiplier = _TRIPLE_MULT.get(a, 5)
+        elif matches:  # Double match
             multiplier = 2
+        else:
+            multiplier = 0
 
         winnings = int(bet * multiplier) - bet
 
@@ -315,7 +501,7 @@ class Aura(commands.Cog):
         )
         embed = discord.Embed(
             title="🎰 AURA SLOTS",
-            description=f"```{slots[0]} {slots[1]} {slots[2]}```",
+            description=f"```{a} {b} {c}```",
             color=result_color,
         )
 
@@ -360,7 +546,7 @@ class Aura(commands.Cog):
 
         # Normalize choice
         user_choice = "heads" if choice.lower() in ["heads", "h"] else "tails"
-        result = random.choice(["heads", "tails"])
+        result = _COIN_SIDES[random.getrandbits(1)]
 
         embed = discord.Embed(title="🪙 Aura Coin Flip", color=discord.Color.orange())
         embed.description = "Flipping..."
@@ -447,19 +633,18 @@ class Aura(commands.Cog):
         """Claim daily aura bonus"""
         aura_data = await self.get_user_aura_data(ctx.author.id, ctx.guild.id)
 
-        now = datetime.now()
+        now = int(time.time())
         last_daily = aura_data.get("daily_last")
 
         if last_daily:
-            last_daily_dt = datetime.fromisoformat(last_daily)
-            if now - last_daily_dt < timedelta(hours=20):  # 20 hour cooldown
-                remaining = timedelta(hours=20) - (now - last_daily_dt)
-                hours = remaining.total_seconds() // 3600
-                minutes = (remaining.total_seconds() % 3600) // 60
-                hours_int = int(hours)
-                minutes_int = int(minutes)
+            # Older records stored the claim time as an ISO string
+            if isinstance(last_daily, str):
+                last_daily = datetime.fromisoformat(last_daily).timestamp()
+            remaining = int(DAILY_COOLDOWN - (now - last_daily))
+            if remaining > 0:
+                hours, minutes = divmod(remaining // 60, 60)
                 await ctx.send(
-                    f"⏰ Daily already claimed! Try again in {hours_int}h {minutes_int}m"
+                    f"⏰ Daily already claimed! Try again in {hours}h {minutes}m"
                 )
                 return
 
@@ -468,25 +653,21 @@ class Aura(commands.Cog):
         streak_bonus = random.randint(0, 50)
         total_reward = base_reward + streak_bonus
 
-        # Random bonus events
-        bonus_events = [
-            (0.05, 500, "🌟 COSMIC ALIGNMENT! Bonus aura rain!"),
-            (0.1, 200, "⚡ Lightning struck your aura!"),
-            (0.15, 100, "🎪 The cosmic carnival visited you!"),
-        ]
+        # Random bonus event: one draw against the cumulative chances
+        i = bisect.bisect_right(_DAILY_BONUS_CUM, random.random())
+        if i < len(_DAILY_BONUS_VALUES):
+            total_reward += _DAILY_BONUS_VALUES[i]
 
-        for chance, bonus, _ in bonus_events:
-            if random.random() < chance:
-                total_reward += bonus
-                break
+        # Grant the reward and stamp the claim time in the same write, so the
+        # timestamp update can't overwrite the new balance with a stale one
+        add_reward = self._aura_change_mutator(total_reward, "daily_reward")
 
-        await self.modify_aura(
-            ctx.author.id, total_reward, ctx.guild.id, "daily_reward"
-        )
+        def claim_daily(user_data: Dict[str, Any]):
+            log_entry = add_reward(user_data)
+            user_data["aura"]["daily_last"] = now
+            return log_entry
 
-        # Update daily timestamp
-        aura_data["daily_last"] = now.isoformat()
-        await self.update_user_aura_data(ctx.author.id, aura_data, ctx.guild.id)
+        await self._modify_user_data([(ctx.author.id, claim_daily)], ctx.guild.id)
 
         daily_msg = random.choice(DAILY_MESSAGES)
         embed = EmbedBuilder.create_success_embed(
@@ -517,8 +698,13 @@ class Aura(commands.Cog):
             return
 
         # Transfer aura
-        await self.modify_aura(ctx.author.id, -amount, ctx.guild.id, "donation_sent")
-        await self.modify_aura(target.id, amount, ctx.guild.id, "donation_received")
+        await self.modify_auras(
+            [
+                (ctx.author.id, -amount, "donation_sent"),
+                (target.id, amount, "donation_received"),
+            ],
+            ctx.guild.id,
+        )
 
         embed = EmbedBuilder.create_success_embed(
             title="💝 Aura Donation",
@@ -546,7 +732,7 @@ class Aura(commands.Cog):
         target_data = await self.get_user_aura_data(target.id, ctx.guild.id)
 
         # Check if target has shield
-        now = datetime.now().timestamp()
+        now = time.time()
         has_shield = (
             target_data.get("shield_expires") and now < target_data["shield_expires"]
         )
@@ -580,11 +766,12 @@ class Aura(commands.Cog):
             if has_shield:
                 drain_amount //= 2  # Shield reduces damage
 
-            await self.modify_aura(
-                target.id, -drain_amount, ctx.guild.id, "drained_by_user"
-            )
-            await self.modify_aura(
-                ctx.author.id, drain_amount, ctx.guild.id, "successful_drain"
+            await self.modify_auras(
+                [
+                    (target.id, -drain_amount, "drained_by_user"),
+                    (ctx.author.id, drain_amount, "successful_drain"),
+                ],
+                ctx.guild.id,
             )
 
             embed = EmbedBuilder.create_success_embed(
@@ -618,61 +805,55 @@ class Aura(commands.Cog):
     )
     async def aura_leaderboard(self, ctx):
         """Display the aura leaderboard"""
-        db = get_db(self.bot)
+        db = self.db
 
-        # Get all users with data in this guild
+        # Let the database extract, sort and limit the aura amounts so only
+        # the top rows come back, with no JSON decoding on our side
         if isinstance(db, SQLiteManager):
             # SQLite query
-            all_users = await db.fetch(
-                "SELECT user_id, data FROM user_data WHERE guild_id = ?",
+            top_users = await db.fetch(
+                """
+                SELECT user_id, json_extract(data, '$.aura.amount') AS amount
+                FROM user_data
+                WHERE guild_id = ?
+                    AND json_valid(data)
+                    AND json_extract(data, '$.aura.amount') IS NOT NULL
+                ORDER BY amount DESC
+                LIMIT ?
+                """,
                 ctx.guild.id,
+                LEADERBOARD_FETCH_SIZE,
             )
         else:
             # PostgreSQL query
-            all_users = await db.fetch(
-                "SELECT user_id, data FROM user_data WHERE guild_id = $1 AND data ? 'aura'",
+            top_users = await db.fetch(
+                """
+                SELECT user_id, (data->'aura'->>'amount')::numeric AS amount
+                FROM user_data
+                WHERE guild_id = $1 AND data->'aura'->>'amount' IS NOT NULL
+                ORDER BY amount DESC
+                LIMIT $2
+                """,
                 ctx.guild.id,
+                LEADERBOARD_FETCH_SIZE,
             )
 
-        if not all_users:
+        if not top_users:
             await ctx.send("❌ No aura data found for this server!")
             return
 
-        # Sort by aura amount
+        # Resolve members rank by rank, stopping once the board is full
         leaderboard_data = []
-        for user_row in all_users:
-            user_id = user_row["user_id"]
-
-            # Handle different data formats
-            if isinstance(db, SQLiteManager):
-                # SQLite stores data as JSON string
-                try:
-                    import json
-
-                    data = (
-                        json.loads(user_row["data"])
-                        if isinstance(user_row["data"], str)
-                        else user_row["data"]
-                    )
-                    if "aura" not in data:
-                        continue
-                    aura_amount = data["aura"]["amount"]
-                except (json.JSONDecodeError, KeyError, TypeError):
-                    continue
-            else:
-                # PostgreSQL stores data as JSONB
-                if "aura" not in user_row["data"]:
-                    continue
-                aura_amount = user_row["data"]["aura"]["amount"]
-
-            user = ctx.guild.get_member(user_id)
+        for user_row in top_users:
+            user = ctx.guild.get_member(user_row["user_id"])
             if user:  # Only include users still in the guild
+                aura_amount = user_row["amount"]
                 title = self.get_aura_title(aura_amount)
                 leaderboard_data.append(
                     {"user": user, "aura": aura_amount, "title": title}
                 )
-
-        leaderboard_data.sort(key=lambda x: x["aura"], reverse=True)
+                if len(leaderboard_data) == LEADERBOARD_SIZE:
+                    break
 
         if not leaderboard_data:
             await ctx.send("❌ No users found with aura data!")
@@ -724,56 +905,14 @@ class Aura(commands.Cog):
     @aura.command(name="titles", description="View available aura titles")
     async def aura_titles(self, ctx):
         """Display all available aura titles and requirements"""
-        embed = discord.Embed(
-            title="👑 Aura Titles",
-            description="Achieve these aura amounts to unlock titles!",
-            color=discord.Color.purple(),
-        )
-
-        # Group titles by positive/negative
-        positive_titles = [(k, v) for k, v in AURA_TITLES.items() if k >= 0]
-        negative_titles = [(k, v) for k, v in AURA_TITLES.items() if k < 0]
-
-        # Sort by requirement
-        positive_titles.sort(key=lambda x: x[0], reverse=True)
-        negative_titles.sort(key=lambda x: x[0])
-
-        # Add positive titles
-        positive_text = ""
-        for req, title in positive_titles:
-            positive_text += f"**{req:,} ✨** - {title}\n"
-
-        embed.add_field(name="✨ Ascension Titles", value=positive_text, inline=True)
-
-        # Add negative titles
-        negative_text = ""
-        for req, title in negative_titles:
-            negative_text += f"**{req:,} ✨** - {title}\n"
-
-        embed.add_field(name="💀 Descent Titles", value=negative_text, inline=True)
-
-        await ctx.send(embed=embed)
+        await ctx.send(embed=EmbedBuilder.clone_embed(self._titles_embed))
 
     @aura.command(name="shop", description="Browse the aura shop")
     async def aura_shop(self, ctx, item: str = None):
         """Browse or buy items from the aura shop"""
         if item is None:
             # Display shop
-            embed = discord.Embed(
-                title="🏪 Aura Shop",
-                description="Purchase powerful items with your aura!",
-                color=discord.Color.blue(),
-            )
-
-            for item_id, item_data in AURA_SHOP.items():
-                embed.add_field(
-                    name=f"{item_data['name']} - {item_data['cost']:,} ✨",
-                    value=item_data["description"],
-                    inline=False,
-                )
-
-            embed.set_footer(text="Use `/aura shop <item>` to purchase!")
-            await ctx.send(embed=embed)
+            await ctx.send(embed=EmbedBuilder.clone_embed(self._shop_embed))
         else:
             # Purchase item
             item_id = item.lower()
@@ -784,38 +923,13 @@ class Aura(commands.Cog):
                 return
 
             item_data = AURA_SHOP[item_id]
-            aura_data = await self.get_user_aura_data(ctx.author.id, ctx.guild.id)
+            name = item_data["name"]
+            cost = item_data["cost"]
 
-            if aura_data["amount"] < item_data["cost"]:
-                cost = item_data["cost"]
-                name = item_data["name"]
+            if await self.purchase_item(ctx.author.id, ctx.guild.id, item_id) is None:
                 await ctx.send(f"❌ You need {cost:,} aura to buy {name}!")
                 return
 
-            # Purchase item
-            await self.modify_aura(
-                ctx.author.id,
-                -item_data["cost"],
-                ctx.guild.id,
-                f"shop_purchase_{item_id}",
-            )
-
-            # Apply item effects
-            now = datetime.now().timestamp()
-
-            if item_id == "shield":
-                aura_data["shield_expires"] = now + item_data["duration"]
-            elif item_id == "multiplier":
-                aura_data["multiplier_expires"] = now + item_data["duration"]
-            elif item_id in ["bomb"]:
-                if "items" not in aura_data:
-                    aura_data["items"] = []
-                aura_data["items"].append(item_id)
-
-            await self.update_user_aura_data(ctx.author.id, aura_data, ctx.guild.id)
-
-            name = item_data["name"]
-            cost = item_data["cost"]
             embed = EmbedBuilder.create_success_embed(
                 title="🛒 Purchase Successful!",
                 description=f"You bought {name} for {cost:,} aura!",
@@ -850,8 +964,7 @@ class Aura(commands.Cog):
         await ctx.send(embed=embed)
 
         # Log action in database
-        db = get_db(self.bot)
-        await db.log_action(
+        await self.db.log_action(
             ctx.guild.id,
             ctx.author.id,
             "admin_aura_add",
@@ -898,8 +1011,7 @@ class Aura(commands.Cog):
         await ctx.send(embed=embed)
 
         # Log action in database
-        db = get_db(self.bot)
-        await db.log_action(
+        await self.db.log_action(
             ctx.guild.id,
             ctx.author.id,
             "admin_aura_remove",
@@ -943,8 +1055,7 @@ class Aura(commands.Cog):
         await ctx.send(embed=embed)
 
         # Log action in database
-        db = get_db(self.bot)
-        await db.log_action(
+        await self.db.log_action(
             ctx.guild.id,
             ctx.author.id,
             "admin_aura_set",
@@ -988,8 +1099,7 @@ class Aura(commands.Cog):
         await ctx.send(embed=embed)
 
         # Log action in database
-        db = get_db(self.bot)
-        await db.log_action(
+        await self.db.log_action(
             ctx.guild.id,
             ctx.author.id,
             "admin_aura_reset",
@@ -1025,8 +1135,13 @@ class Aura(commands.Cog):
         erika_id = 277200034469117955
 
         # Give +1 aura to user, -0.1 to Erika
-        await self.modify_aura(ctx.author.id, 1, ctx.guild.id, "erika_tribute_received")
-        await self.modify_aura(erika_id, -0.1, ctx.guild.id, "erika_tribute_given")
+        await self.modify_auras(
+            [
+                (ctx.author.id, 1, "erika_tribute_received"),
+                (erika_id, -0.1, "erika_tribute_given"),
+            ],
+            ctx.guild.id,
+        )
 
         embed = EmbedBuilder.create_success_embed(
             title="🌸 Erika's Blessing",
@@ -1044,11 +1159,12 @@ class Aura(commands.Cog):
         # +10,000,000 aura to user, -10,000,000 to bot owner
         bot_owner_id = self.bot.owner_id or 123456789  # Replace with actual owner ID
 
-        await self.modify_aura(
-            ctx.author.id, 10000000, ctx.guild.id, "opticcat_blessing"
-        )
-        await self.modify_aura(
-            bot_owner_id, -10000000, ctx.guild.id, "opticcat_sacrifice"
+        await self.modify_auras(
+            [
+                (ctx.author.id, 10000000, "opticcat_blessing"),
+                (bot_owner_id, -10000000, "opticcat_sacrifice"),
+            ],
+            ctx.guild.id,
         )
 
         embed = discord.Embed(
@@ -2,11 +2,23 @@ import discord
 from discord.ext import commands, tasks
 from datetime import datetime
 import logging
+import re
 from utils.checks import is_admin
 from utils.database import get_db
 
 logger = logging.getLogger(__name__)
 
+# Discord embed limits
+MAX_EMBED_FIELDS = 25
+MAX_FIELD_VALUE = 1024
+# Room for a code block inside the 4096 character description
+MAX_LISTING = 4000
+
+# Raw queries must start with SELECT and contain a single statement; a
+# semicolon may only be followed by trailing whitespace
+_SELECT_RE = re.compile(r"^\s*SELECT\b", re.IGNORECASE)
+_MULTI_STATEMENT_RE = re.compile(r";\s*\S")
+
 
 class DatabaseDemo(commands.Cog):
     """Demo cog showing database integration with commands and tasks"""
@@ -96,9 +108,13 @@ class DatabaseDemo(commands.Cog):
                     value=version.split()[1] if version else "Unknown",
                     inline=True,
                 )
+                pool = self.bot.db.pool
                 embed.add_field(
                     name="Pool Status",
-                    value=f"Min: {self.bot.db.pool.get_min_size()}, Max: {self.bot.db.pool.get_max_size()}",
+                    value=(
+                        f"Open: {pool.get_size()}, Min: {pool.get_min_size()}, "
+                        f"Max: {pool.get_max_size()}"
+                    ),
                     inline=True,
                 )
 
@@ -184,16 +200,23 @@ class DatabaseDemo(commands.Cog):
                 # Get all user data
                 data = await self.bot.db.get_user_data(member.id, ctx.guild.id)
 
-                embed = discord.Embed(
-                    title=f"User Data for {member.display_name}",
-                    color=discord.Color.blue(),
-                )
-
-                if data:
-                    for k, v in data.items():
-                        embed.add_field(name=k, value=str(v), inline=True)
+                embed_data = {
+                    "title": f"User Data for {member.display_name}",
+                    "color": discord.Color.blue().value,
+                }
+                if not data:
+                    embed_data["description"] = "No data found for this user"
+                elif len(data) <= MAX_EMBED_FIELDS:
+                    # Hand the whole field list to from_dict in one go
+                    embed_data["fields"] = [
+                        {"name": k, "value": str(v)[:MAX_FIELD_VALUE], "inline": True}
+                        for k, v in data.items()
+                    ]
                 else:
-                    embed.description = "No data found for this user"
+                    # Too many keys for fields; list them in the description
+                    lines = "\n".join(f"{k}: {v}" for k, v in data.items())
+                    embed_data["description"] = f"```\n{lines[:MAX_LISTING]}\n```"
+                embed = discord.Embed.from_dict(embed_data)
 
             elif value is None:
                 # Get specific key
@@ -237,15 +260,15 @@ class DatabaseDemo(commands.Cog):
         Parameters
         ----------
         limit : int, optional
-            Number of logs to show (max 50)
+            Number of logs to show (max 10)
         """
         if not self.bot.db:
             await ctx.send("❌ Database not available!")
             return
 
         try:
-            if limit > 50:
-                limit = 50  # Cap at 50 for performance
+            # Only 10 fit in the embed, so don't fetch more than that
+            limit = min(limit, 10)
 
             logs = await self.bot.db.get_recent_logs(ctx.guild.id, limit)
 
@@ -262,8 +285,15 @@ class DatabaseDemo(commands.Cog):
                     timestamp=datetime.utcnow(),
                 )
 
-                for log in logs[:10]:  # Show max 10 in embed
-                    user = self.bot.get_user(log["user_id"])
+                # Resolve each distinct user once, preferring the guild's
+                # member map over the global user cache
+                users = {
+                    user_id: ctx.guild.get_member(user_id) or self.bot.get_user(user_id)
+                    for user_id in {log["user_id"] for log in logs}
+                }
+
+                for log in logs:
+                    user = users[log["user_id"]]
                     user_name = user.name if user else f"User {log['user_id']}"
 
                     embed.add_field(
@@ -335,42 +365,41 @@ class DatabaseDemo(commands.Cog):
             return
 
         # Security check - only allow SELECT statements
-        if not query.strip().upper().startswith("SELECT"):
-            await ctx.send("❌ Only SELECT queries are allowed for security!")
+        if not _SELECT_RE.match(query) or _MULTI_STATEMENT_RE.search(query):
+            await ctx.send("❌ Only a single SELECT query is allowed for security!")
             return
 
         try:
-            result = await self.bot.db.fetch(query)
+            # Pull one row past what is shown to learn whether there are more
+            rows, has_more = await self.bot.db.fetch_limited(query, 10)
 
-            if not result:
+            if not rows:
                 embed = discord.Embed(
                     title="Query Result",
                     description="No results returned",
                     color=discord.Color.blue(),
                 )
             else:
-                # Format results (limit to first 10 rows)
-                rows = result[:10]
-
+                row_count = f"{len(rows)}+" if has_more else str(len(rows))
                 embed = discord.Embed(
-                    title=f"Query Result ({len(result)} rows)",
+                    title=f"Query Result ({row_count} rows)",
                     color=discord.Color.green(),
                     timestamp=datetime.utcnow(),
                 )
 
-                # Convert rows to readable format
-                result_text = "```\n"
-                for i, row in enumerate(rows):
-                    result_text += f"Row {i + 1}: {dict(row)}\n"
-                result_text += "```"
+                # Convert rows to readable format in a single join
+                body = "".join(
+                    f"Row {i}: {dict(row)}\n" for i, row in enumerate(rows, 1)
+                )
+                result_text = f"```\n{body}```"
 
                 if len(result_text) > 1024:
                     result_text = result_text[:1020] + "...```"
 
                 embed.add_field(name="Results", value=result_text, inline=False)
 
-                if len(result) > 10:
-                    embed.set_footer(text=f"Showing first 10 of {len(result)} rows")
+                if has_more:
+                    embed.set_footer(text=f"Showing first {len(rows)} rows")
 
             await ctx.send(embed=embed)
 
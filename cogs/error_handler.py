@@ -1,13 +1,221 @@
 import discord
 from discord.ext import commands
+import functools
 import logging
-import traceback
+import queue
 import sys
-from typing import Optional
+import weakref
+from logging.handlers import QueueHandler, QueueListener
+from typing import Callable, Dict, Optional, Type
 from utils.menus import EmbedBuilder
 
 logger = logging.getLogger(__name__)
 
+# Builds the embed to show for an error, or returns None to stay silent
+ErrorResponder = Callable[[commands.Context, Exception], Optional[discord.Embed]]
+
+
+# Usage hint per command object; weak keys let reloaded commands drop out
+_usage_cache: "weakref.WeakKeyDictionary[commands.Command, str]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _usage(command: commands.Command) -> str:
+    usage = _usage_cache.get(command)
+    if usage is None:
+        usage = _usage_cache[command] = (
+            f"**Usage:** `!{command.qualified_name} {command.signature}`\n"
+            f"Use `!help {command.qualified_name}` for more information."
+        )
+    return usage
+
+
+# Whether a command (or its cog) has its own error handler, worked out on
+# the command's first error; handlers are attached when commands are defined
+_local_handler_cache: "weakref.WeakKeyDictionary[commands.Command, bool]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _handled_locally(command: Optional[commands.Command]) -> bool:
+    if command is None:
+        return False
+    handled = _local_handler_cache.get(command)
+    if handled is None:
+        cog = command.cog
+        handled = _local_handler_cache[command] = hasattr(command, "on_error") or (
+            cog is not None and cog.has_error_handler()
+        )
+    return handled
+
+
+def _command_not_found(ctx, error):
+    # Silently ignore command not found errors
+    return None
+
+
+def _disabled_command(ctx, error):
+    return EmbedBuilder.create_error_embed(
+        "Command Disabled",
+        f"The command `{ctx.command}` has been disabled and cannot be used.",
+    )
+
+
+def _missing_required_argument(ctx, error):
+    return EmbedBuilder.create_error_embed(
+        "Missing Required Argument",
+        f"You're missing the required argument: `{error.param.name}`\n\n"
+        + _usage(ctx.command),
+    )
+
+
+def _bad_argument(ctx, error):
+    return EmbedBuilder.create_error_embed(
+        "Invalid Argument",
+        f"Invalid argument provided: {str(error)}\n\n" + _usage(ctx.command),
+    )
+
+
+def _too_many_arguments(ctx, error):
+    return EmbedBuilder.create_error_embed(
+        "Too Many Arguments",
+        "You provided too many arguments for this command.\n\n" + _usage(ctx.command),
+    )
+
+
+def _missing_permissions(ctx, error):
+    perms = ", ".join(error.missing_permissions)
+    return EmbedBuilder.create_error_embed(
+        "Missing Permissions",
+        f"You don't have the required permissions to use this command.\n\n"
+        f"**Required permissions:** {perms}",
+    )
+
+
+def _bot_missing_permissions(ctx, error):
+    perms = ", ".join(error.missing_permissions)
+    return EmbedBuilder.create_error_embed(
+        "Bot Missing Permissions",
+        f"I don't have the required permissions to execute this command.\n\n"
+        f"**Required permissions:** {perms}\n"
+        f"Please contact a server administrator to grant these permissions.",
+    )
+
+
+def _command_on_cooldown(ctx, error):
+    return EmbedBuilder.create_error_embed(
+        "Command On Cooldown",
+        f"This command is on cooldown. Try again in {error.retry_after:.2f} seconds.",
+    )
+
+
+def _http_exception(ctx, error):
+    # discord.py raises a plain 429 HTTPException once its own retries run out
+    if error.status == 429:
+        return _rate_limited(ctx, error)
+    return EmbedBuilder.create_error_embed(
+        "Discord Error", f"Discord returned an error: {error.text}"
+    )
+
+
+def _extension_error(ctx, error):
+    # Extension-related errors (for debugging)
+    logger.error("Extension error in command %s: %s", ctx.command, error)
+    return _extension_error_response(ctx, error)
+
+
+def _unexpected_error(ctx, error):
+    # exc_info defers formatting the traceback until a handler emits it
+    logger.error(
+        "Unexpected error in command %s: %s", ctx.command, error, exc_info=error
+    )
+    return _unexpected_error_response(ctx, error)
+
+
+def _static_response(title: str, description: str) -> ErrorResponder:
+    """Build the embed once and hand out timestamped copies of it"""
+    embed = EmbedBuilder.create_error_embed(title, description)
+
+    def respond(ctx, error):
+        response = embed.copy()
+        response.timestamp = discord.utils.utcnow()
+        return response
+
+    return respond
+
+
+# Errors whose message never changes
+_check_failure = _static_response(
+    "Check Failed", "You don't have permission to use this command."
+)
+_max_concurrency_reached = _static_response(
+    "Command In Use",
+    "This command is already being used. Please wait for it to finish.",
+)
+_not_owner = _static_response(
+    "Owner Only", "This command can only be used by the bot owner."
+)
+_private_message_only = _static_response(
+    "DM Only", "This command can only be used in direct messages."
+)
+_no_private_message = _static_response(
+    "Server Only", "This command cannot be used in direct messages."
+)
+_forbidden = _static_response(
+    "Permission Denied",
+    "I don't have permission to perform this action. Please check my role permissions.",
+)
+_not_found = _static_response(
+    "Not Found",
+    "The requested resource could not be found. It may have been deleted or moved.",
+)
+_rate_limited = _static_response(
+    "Rate Limited",
+    "I'm being rate limited by Discord. Please try again in a few moments.",
+)
+_extension_error_response = _static_response(
+    "Extension Error",
+    "An error occurred with a bot extension. This has been logged.",
+)
+_unexpected_error_response = _static_response(
+    "Unexpected Error",
+    "An unexpected error occurred while processing this command. "
+    "This has been logged and will be investigated.",
+)
+
+
+_ERROR_RESPONDERS: Dict[Type[Exception], ErrorResponder] = {
+    commands.CommandNotFound: _command_not_found,
+    commands.DisabledCommand: _disabled_command,
+    commands.MissingRequiredArgument: _missing_required_argument,
+    commands.BadArgument: _bad_argument,
+    commands.TooManyArguments: _too_many_arguments,
+    commands.MissingPermissions: _missing_permissions,
+    commands.BotMissingPermissions: _bot_missing_permissions,
+    commands.CheckFailure: _check_failure,
+    commands.CommandOnCooldown: _command_on_cooldown,
+    commands.MaxConcurrencyReached: _max_concurrency_reached,
+    commands.NotOwner: _not_owner,
+    commands.PrivateMessageOnly: _private_message_only,
+    commands.NoPrivateMessage: _no_private_message,
+    discord.Forbidden: _forbidden,
+    discord.NotFound: _not_found,
+    discord.RateLimited: _rate_limited,
+    discord.HTTPException: _http_exception,
+    commands.ExtensionError: _extension_error,
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _responder_for(error_type: Type[Exception]) -> ErrorResponder:
+    """Find the responder for the closest registered class in the error's MRO"""
+    for cls in error_type.__mro__:
+        responder = _ERROR_RESPONDERS.get(cls)
+        if responder is not None:
+            return responder
+    return _unexpected_error
+
 
 class ErrorHandler(commands.Cog):
     """Global error handler for the Discord bot"""
@@ -24,13 +232,8 @@ class ErrorHandler(commands.Cog):
         Handles various types of command errors and provides user-friendly responses
         """
 
-        # Don't handle errors that have already been handled locally
-        if hasattr(ctx.command, "on_error"):
-            return
-
         # Don't handle errors for commands that have local error handlers
-        cog = ctx.cog
-        if cog and cog.has_error_handler():
+        if _handled_locally(ctx.command):
             return
 
         # Extract the original error from CommandInvokeError
@@ -42,140 +245,11 @@ class ErrorHandler(commands.Cog):
             logger.info("KeyboardInterrupt received, shutting down bot...")
             raise error
 
-        # Handle specific error types
-        embed = None
-        send_to_user = True
-
-        if isinstance(error, commands.CommandNotFound):
-            # Silently ignore command not found errors
-            send_to_user = False
-
-        elif isinstance(error, commands.DisabledCommand):
-            embed = EmbedBuilder.create_error_embed(
-                "Command Disabled",
-                f"The command `{ctx.command}` has been disabled and cannot be used.",
-            )
-
-        elif isinstance(error, commands.MissingRequiredArgument):
-            embed = EmbedBuilder.create_error_embed(
-                "Missing Required Argument",
-                f"You're missing the required argument: `{error.param.name}`\n\n"
-                f"**Usage:** `!{ctx.command.qualified_name} {ctx.command.signature}`\n"
-                f"Use `!help {ctx.command.qualified_name}` for more information.",
-            )
-
-        elif isinstance(error, commands.BadArgument):
-            embed = EmbedBuilder.create_error_embed(
-                "Invalid Argument",
-                f"Invalid argument provided: {str(error)}\n\n"
-                f"**Usage:** `!{ctx.command.qualified_name} {ctx.command.signature}`\n"
-                f"Use `!help {ctx.command.qualified_name}` for more information.",
-            )
-
-        elif isinstance(error, commands.TooManyArguments):
-            embed = EmbedBuilder.create_error_embed(
-                "Too Many Arguments",
-                f"You provided too many arguments for this command.\n\n"
-                f"**Usage:** `!{ctx.command.qualified_name} {ctx.command.signature}`\n"
-                f"Use `!help {ctx.command.qualified_name}` for more information.",
-            )
-
-        elif isinstance(error, commands.MissingPermissions):
-            perms = ", ".join(error.missing_permissions)
-            embed = EmbedBuilder.create_error_embed(
-                "Missing Permissions",
-                f"You don't have the required permissions to use this command.\n\n"
-                f"**Required permissions:** {perms}",
-            )
-
-        elif isinstance(error, commands.BotMissingPermissions):
-            perms = ", ".join(error.missing_permissions)
-            embed = EmbedBuilder.create_error_embed(
-                "Bot Missing Permissions",
-                f"I don't have the required permissions to execute this command.\n\n"
-                f"**Required permissions:** {perms}\n"
-                f"Please contact a server administrator to grant these permissions.",
-            )
-
-        elif isinstance(error, commands.CheckFailure):
-            embed = EmbedBuilder.create_error_embed(
-                "Check Failed", "You don't have permission to use this command."
-            )
-
-        elif isinstance(error, commands.CommandOnCooldown):
-            embed = EmbedBuilder.create_error_embed(
-                "Command On Cooldown",
-                f"This command is on cooldown. Try again in {error.retry_after:.2f} seconds.",
-            )
-
-        elif isinstance(error, commands.MaxConcurrencyReached):
-            embed = EmbedBuilder.create_error_embed(
-                "Command In Use",
-                f"This command is already being used. Please wait for it to finish.",
-            )
-
-        elif isinstance(error, commands.NotOwner):
-            embed = EmbedBuilder.create_error_embed(
-                "Owner Only", "This command can only be used by the bot owner."
-            )
-
-        elif isinstance(error, commands.PrivateMessageOnly):
-            embed = EmbedBuilder.create_error_embed(
-                "DM Only", "This command can only be used in direct messages."
-            )
-
-        elif isinstance(error, commands.NoPrivateMessage):
-            embed = EmbedBuilder.create_error_embed(
-                "Server Only", "This command cannot be used in direct messages."
-            )
-
-        elif isinstance(error, discord.Forbidden):
-            embed = EmbedBuilder.create_error_embed(
-                "Permission Denied",
-                "I don't have permission to perform this action. Please check my role permissions.",
-            )
-
-        elif isinstance(error, discord.NotFound):
-            embed = EmbedBuilder.create_error_embed(
-                "Not Found",
-                "The requested resource could not be found. It may have been deleted or moved.",
-            )
-
-        elif isinstance(error, discord.HTTPException):
-            if error.status == 429:  # Rate limited
-                embed = EmbedBuilder.create_error_embed(
-                    "Rate Limited",
-                    "I'm being rate limited by Discord. Please try again in a few moments.",
-                )
-            else:
-                embed = EmbedBuilder.create_error_embed(
-                    "Discord Error", f"Discord returned an error: {error.text}"
-                )
-
-        elif isinstance(error, commands.ExtensionError):
-            # Extension-related errors (for debugging)
-            logger.error("Extension error in command %s: %s", ctx.command, error)
-            embed = EmbedBuilder.create_error_embed(
-                "Extension Error",
-                "An error occurred with a bot extension. This has been logged.",
-            )
-
-        else:
-            # Unknown/unexpected error
-            logger.error("Unexpected error in command %s: %s", ctx.command, error)
-            logger.error(
-                "Full traceback: %s",
-                traceback.format_exception(type(error), error, error.__traceback__),
-            )
-
-            embed = EmbedBuilder.create_error_embed(
-                "Unexpected Error",
-                "An unexpected error occurred while processing this command. "
-                "This has been logged and will be investigated.",
-            )
+        # Pick the response for the most specific matching error type
+        embed = _responder_for(type(error))(ctx, error)
 
         # Send error message to user if applicable
-        if send_to_user and embed:
+        if embed:
             try:
                 await ctx.send(embed=embed)
             except discord.HTTPException:
@@ -205,20 +279,23 @@ class ErrorHandler(commands.Cog):
             raise exc_value
 
         # Log the error
-        logger.error("Error in event %s: %s", event, exc_value)
         logger.error(
-            "Full traceback: %s",
-            traceback.format_exception(exc_type, exc_value, exc_traceback),
+            "Error in event %s: %s",
+            event,
+            exc_value,
+            exc_info=(exc_type, exc_value, exc_traceback),
         )
 
-        # Try to get more context about the error
-        error_context = {
-            "event": event,
-            "args": str(args)[:200] if args else "None",
-            "kwargs": str(kwargs)[:200] if kwargs else "None",
-        }
+        # Try to get more context about the error; repr'ing the event
+        # arguments can be costly, so skip it when the record would be dropped
+        if logger.isEnabledFor(logging.ERROR):
+            error_context = {
+                "event": event,
+                "args": str(args)[:200] if args else "None",
+                "kwargs": str(kwargs)[:200] if kwargs else "None",
+            }
 
-        logger.error("Error context: %s", error_context)
+            logger.error("Error context: %s", error_context)
 
     @commands.Cog.listener()
     async def on_command_completion(self, ctx: commands.Context):
@@ -258,6 +335,11 @@ class ErrorHandler(commands.Cog):
 class ErrorLogging:
     """Utility class for error logging and reporting"""
 
+    # The error logger only enqueues records; the listener thread does the
+    # file writes so they never block the event loop
+    _queue_handler: Optional[QueueHandler] = None
+    _listener: Optional[QueueListener] = None
+
     @staticmethod
     def setup_logging():
         """Setup enhanced logging for error tracking"""
@@ -273,11 +355,27 @@ class ErrorLogging:
                     "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
                 )
                 handler.setFormatter(formatter)
-                error_logger.addHandler(handler)
+
+                log_queue = queue.SimpleQueue()
+                ErrorLogging._queue_handler = QueueHandler(log_queue)
+                ErrorLogging._listener = QueueListener(log_queue, handler)
+                ErrorLogging._listener.start()
+                error_logger.addHandler(ErrorLogging._queue_handler)
                 logger.info("Error logging to file enabled")
             except Exception as e:
                 logger.warning("Could not setup error file logging: %s", e)
 
+    @staticmethod
+    def stop_logging():
+        """Flush queued error records to the file and stop the listener"""
+        if ErrorLogging._listener is not None:
+            logging.getLogger("bot_errors").removeHandler(ErrorLogging._queue_handler)
+            ErrorLogging._listener.stop()
+            for handler in ErrorLogging._listener.handlers:
+                handler.close()
+            ErrorLogging._listener = None
+            ErrorLogging._queue_handler = None
+
     @staticmethod
     async def log_error_to_channel(bot, error: Exception, context: str = None):
         """
@@ -310,3 +408,8 @@ async def setup(bot):
     # Add the error handler cog
     await bot.add_cog(ErrorHandler(bot))
     logger.info("Global error handler loaded")
+
+
+async def teardown(bot):
+    # Write out any error records still queued for the log file
+    ErrorLogging.stop_logging()
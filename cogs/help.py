@@ -1,7 +1,17 @@
 import discord
 from discord.ext import commands
-from typing import Dict, List, Optional
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
 import logging
+from datetime import datetime
 from utils.menus import (
     EmbedBuilder,
     PaginatedEmbed,
@@ -13,6 +23,104 @@ from utils.checks import is_admin
 
 logger = logging.getLogger(__name__)
 
+# Help category for each cog class; commands from any other cog are Utility
+_COG_TO_CATEGORY = {
+    "Moderation": "🛡️ Moderation",
+    "Admin": "⚡ Admin",
+    "Tasks": "🔄 Tasks",
+    "DatabaseDemo": "🗄️ Database",
+    "HelpCommand": "❓ Help",
+}
+_DEFAULT_CATEGORY = "🔧 Utility"
+# Display order of the categories in help output
+_CATEGORY_ORDER = (*_COG_TO_CATEGORY.values(), _DEFAULT_CATEGORY)
+
+# Command embed color for each cog class
+_COG_COLORS = {
+    "Moderation": discord.Color.red(),
+    "Admin": discord.Color.orange(),
+    "Tasks": discord.Color.purple(),
+}
+_DEFAULT_COG_COLOR = discord.Color.blue()
+
+
+def _split_category_name(category_name: str) -> Tuple[str, str]:
+    """Split a category name like "🛡️ Moderation" into its emoji and label"""
+    parts = category_name.split()
+    emoji = parts[0] if parts else "📁"
+    clean_name = " ".join(parts[1:]) if len(parts) > 1 else category_name
+
+    # Ensure we have a valid clean name
+    return emoji, clean_name or "Unknown"
+
+
+# (emoji, label) for each category, as shown in the dropdown
+_CATEGORY_LABELS = {name: _split_category_name(name) for name in _CATEGORY_ORDER}
+
+# First entry of the help dropdown
+_MAIN_MENU_OPTION = discord.SelectOption(
+    label="Main Menu",
+    value="main",
+    description="Return to the main help menu",
+    emoji="🏠",
+)
+
+# Names accepted by `!help <name>` for whole categories; "all" lists every
+# command
+_CATEGORY_SHORTCUTS = {
+    "mod": "🛡️ Moderation",
+    "moderation": "🛡️ Moderation",
+    "admin": "⚡ Admin",
+    "administrator": "⚡ Admin",
+    "task": "🔄 Tasks",
+    "tasks": "🔄 Tasks",
+    "db": "🗄️ Database",
+    "database": "🗄️ Database",
+    "util": "🔧 Utility",
+    "utility": "🔧 Utility",
+    "commands": "all",
+}
+
+# Static text of the !about embed
+_ABOUT_DESCRIPTION = (
+    "A comprehensive Discord bot built with discord.py featuring "
+    "modular architecture, database integration, and modern UI components."
+)
+_ABOUT_FEATURES_VALUE = "\n".join(
+    [
+        "🛡️ Moderation Tools",
+        "⚡ Admin Commands",
+        "🔄 Background Tasks",
+        "🗄️ Database Integration",
+        "🌐 HTTP Session Management",
+        "📝 Comprehensive Logging",
+        "🎨 Interactive Menus",
+        "✅ Environment Validation",
+    ]
+)
+_ABOUT_LINKS_VALUE = (
+    "[GitHub Repository](https://github.com/your-repo)\n"
+    "[Support Server](https://discord.gg/your-server)\n"
+    "[Invite Bot](https://discord.com/oauth2/authorize)"
+)
+
+
+class CategoryDef(NamedTuple):
+    """A help category with its display parts and visible commands"""
+
+    key: str
+    emoji: str
+    clean_name: str
+    commands: Tuple[commands.Command, ...]
+
+
+class _CategoryIndex(NamedTuple):
+    """Visible commands by category, plus their total, from one pass"""
+
+    categories: Tuple[CategoryDef, ...]
+    by_key: Dict[str, CategoryDef]
+    visible_count: int
+
 
 class HelpCommand(commands.Cog):
     """Interactive help command with beautiful menus"""
@@ -20,50 +128,245 @@ class HelpCommand(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.bot.remove_command("help")  # Remove default help command
+        # Built help embeds by key ("main", "category:<name>", "command:<name>")
+        self._embed_cache: Dict[str, discord.Embed] = {}
+        self._about_template: Optional[discord.Embed] = None
+        self._sig_cache: Dict[str, str] = {}
+        self._category_index: Optional[_CategoryIndex] = None
+        self._select_options: Optional[List[discord.SelectOption]] = None
+        self._app_info: Optional[discord.AppInfo] = None
+        # Server and member totals, kept up to date by the listeners below
+        self._cached_guild_count = 0
+        self._cached_user_count = 0
+        # Last formatted statistics, with the counts it was built from
+        self._stats_value: Optional[Tuple[Tuple[int, int, int], str]] = None
+        self._recount_users()
+
+    def _recount_users(self):
+        """
+        Recompute the cached server and member totals from the guild cache
+
+        Between recounts the totals only move with join/leave events, so they
+        follow what the gateway reports: guilds still unavailable at ready
+        count with no members, and the user total counts a person once per
+        shared server.
+        """
+        guilds = self.bot.guilds
+        self._cached_guild_count = len(guilds)
+        self._cached_user_count = sum(guild.member_count or 0 for guild in guilds)
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        self._recount_users()
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild):
+        self._cached_guild_count += 1
+        self._cached_user_count += guild.member_count or 0
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self._cached_guild_count -= 1
+        self._cached_user_count -= guild.member_count or 0
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        self._cached_user_count += 1
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        self._cached_user_count -= 1
+
+    @commands.Cog.listener()
+    async def on_extensions_changed(self):
+        """Drop cached help output when cogs are loaded, unloaded or reloaded"""
+        self._embed_cache.clear()
+        self._sig_cache.clear()
+        self._category_index = None
+        self._select_options = None
+
+    def get_command_signature(self, command: commands.Command) -> str:
+        """Get the usage string for a command, memoized per qualified name"""
+        signature = self._sig_cache.get(command.qualified_name)
+        if signature is None:
+            signature = f"!{command.qualified_name}"
+            if command.signature:
+                signature += f" {command.signature}"
+            self._sig_cache[command.qualified_name] = signature
+        return signature
+
+    def get_command_categories(self) -> Tuple[CategoryDef, ...]:
+        """
+        Get the non-empty categories with their commands, in display order
+
+        The result is cached until extensions change.
+        """
+        return self._get_category_index().categories
 
-    def get_command_categories(self) -> Dict[str, List[commands.Command]]:
-        """Get commands organized by category"""
-        categories = {
-            "🛡️ Moderation": [],
-            "⚡ Admin": [],
-            "🔄 Tasks": [],
-            "🗄️ Database": [],
-            "❓ Help": [],
-            "🔧 Utility": [],
-        }
+    def get_category(self, key: str) -> Optional[CategoryDef]:
+        """Get a non-empty category by its full name"""
+        return self._get_category_index().by_key.get(key)
+
+    def get_visible_command_count(self) -> int:
+        """Number of commands shown in help, from the cached category pass"""
+        return self._get_category_index().visible_count
+
+    def _get_category_index(self) -> _CategoryIndex:
+        if self._category_index is None:
+            self._category_index = self._build_category_index()
+        return self._category_index
+
+    def _build_category_index(self) -> _CategoryIndex:
+        categories = {name: [] for name in _CATEGORY_ORDER}
+        visible_count = 0
 
         for command in self.bot.commands:
             # Skip hidden commands
             if command.hidden:
                 continue
+            visible_count += 1
+
+            # Commands without a cog (shouldn't happen) count as Utility
+            cog = command.cog
+            category = (
+                _COG_TO_CATEGORY.get(type(cog).__name__, _DEFAULT_CATEGORY)
+                if cog
+                else _DEFAULT_CATEGORY
+            )
+            categories[category].append(command)
 
-            # Skip if command has no cog (shouldn't happen but safety check)
-            if not hasattr(command, "cog") or not command.cog:
-                categories["🔧 Utility"].append(command)
-                continue
+        # Remove empty categories and return
+        defs = tuple(
+            CategoryDef(key, *_CATEGORY_LABELS[key], tuple(cmds))
+            for key, cmds in categories.items()
+            if cmds
+        )
+        return _CategoryIndex(defs, {cat.key: cat for cat in defs}, visible_count)
 
-            # Get cog name safely
-            cog_name = command.cog.__class__.__name__ if command.cog else "Unknown"
-
-            # Categorize based on cog name
-            if cog_name == "Moderation":
-                categories["🛡️ Moderation"].append(command)
-            elif cog_name == "Admin":
-                categories["⚡ Admin"].append(command)
-            elif cog_name == "Tasks":
-                categories["🔄 Tasks"].append(command)
-            elif cog_name == "DatabaseDemo":
-                categories["🗄️ Database"].append(command)
-            elif cog_name == "HelpCommand":
-                categories["❓ Help"].append(command)
-            else:
-                categories["🔧 Utility"].append(command)
+    def get_select_options(self) -> List[discord.SelectOption]:
+        """
+        Get the category dropdown options, building them once per set of
+        categories
 
-        # Remove empty categories and return
-        return {k: v for k, v in categories.items() if v}
+        Returns a new list each time, since the select keeps the list it is
+        given; the options themselves are shared.
+        """
+        if self._select_options is None:
+            options = [_MAIN_MENU_OPTION]
+
+            for category in self.get_command_categories():
+                clean_name = category.clean_name
+
+                # Truncate label if too long (Discord limit is 100 chars)
+                if len(clean_name) > 95:
+                    clean_name = clean_name[:92] + "..."
+
+                # Truncate description if too long (Discord limit is 100 chars)
+                description = f"View all {clean_name.lower()} commands"
+                if len(description) > 95:
+                    description = description[:92] + "..."
+
+                options.append(
+                    discord.SelectOption(
+                        label=clean_name,
+                        value=category.key,
+                        description=description,
+                        emoji=category.emoji,
+                    )
+                )
+
+            # Limit to 25 options (Discord's limit)
+            self._select_options = options[:25]
+
+        return list(self._select_options)
+
+    def _get_cached_embed(
+        self,
+        key: str,
+        build: Callable[[], discord.Embed],
+        timestamp: Optional[datetime] = None,
+    ) -> discord.Embed:
+        """
+        Get a copy of a cached embed stamped with timestamp (now by default),
+        building it on first use
+
+        The copy is independent of the cached embed, so callers may add fields
+        or change the footer freely.
+        """
+        cached = self._embed_cache.get(key)
+        if cached is None:
+            cached = self._embed_cache[key] = build()
+
+        embed = EmbedBuilder.clone_embed(cached)
+        embed.timestamp = timestamp or datetime.utcnow()
+        return embed
+
+    def get_category_embed(
+        self, category: CategoryDef, timestamp: Optional[datetime] = None
+    ) -> discord.Embed:
+        """Get the embed for a category, reusing the cached build"""
+        return self._get_cached_embed(
+            f"category:{category.key}",
+            lambda: self.create_category_embed(category.key, category.commands),
+            timestamp,
+        )
+
+    def get_command_embed(self, command: commands.Command) -> discord.Embed:
+        """Get the detailed embed for a command, reusing the cached build"""
+        return self._get_cached_embed(
+            f"command:{command.qualified_name}",
+            lambda: self.create_command_embed(command),
+        )
+
+    def get_all_commands_embeds(
+        self, categories: Iterable[CategoryDef]
+    ) -> List[discord.Embed]:
+        """Get one embed per category, reusing the cached builds"""
+        # Every page of the listing shares one timestamp
+        now = datetime.utcnow()
+        return [
+            self.get_category_embed(category, now)
+            for category in categories
+            if category.commands
+        ]
 
     def create_main_help_embed(self) -> discord.Embed:
         """Create the main help embed"""
+        # The statistics change between calls, so they are added to a copy of
+        # the cached static part
+        embed = self._get_cached_embed("main", self._build_main_help_template)
+
+        # Add bot statistics
+        embed.insert_field_at(
+            0,
+            name="📊 Bot Statistics",
+            value=self._build_stats_value(),
+            inline=True,
+        )
+        return embed
+
+    def _build_stats_value(self) -> str:
+        """
+        Format the server, user and command counts, reusing the last string
+        while the counts are unchanged
+        """
+        counts = (
+            self._cached_guild_count,
+            self._cached_user_count,
+            self.get_visible_command_count(),
+        )
+        if self._stats_value is None or self._stats_value[0] != counts:
+            guild_count, user_count, command_count = counts
+            self._stats_value = (
+                counts,
+                f"**Servers:** {guild_count:,}\n"
+                f"**Users:** {user_count:,}\n"
+                f"**Commands:** {command_count}",
+            )
+        return self._stats_value[1]
+
+    def _build_main_help_template(self) -> discord.Embed:
+        """Build the main help embed without its statistics field"""
         description = (
             "Welcome to the help system! This bot features modular commands "
             "organized into different categories.\n\n"
@@ -82,24 +385,6 @@ class HelpCommand(commands.Cog):
             description=description,
             color=discord.Color.blue(),
             thumbnail=self.bot.user.display_avatar.url if self.bot.user else None,
-            timestamp=True,
-        )
-
-        # Add bot statistics
-        guild_count = len(self.bot.guilds)
-        user_count = sum(guild.member_count or 0 for guild in self.bot.guilds)
-        command_count = len([cmd for cmd in self.bot.commands if not cmd.hidden])
-
-        stats_value = (
-            f"**Servers:** {guild_count:,}\n"
-            f"**Users:** {user_count:,}\n"
-            f"**Commands:** {command_count}"
-        )
-
-        embed.add_field(
-            name="📊 Bot Statistics",
-            value=stats_value,
-            inline=True,
         )
 
         # Add useful information - make this shorter to avoid limits
@@ -119,7 +404,7 @@ class HelpCommand(commands.Cog):
         return embed
 
     def create_category_embed(
-        self, category_name: str, commands_list: List[commands.Command]
+        self, category_name: str, commands_list: Sequence[commands.Command]
     ) -> discord.Embed:
         """Create an embed for a specific category"""
         embed = EmbedBuilder.create_embed(
@@ -141,9 +426,7 @@ class HelpCommand(commands.Cog):
                 break
 
             # Get command signature
-            signature = f"!{command.qualified_name}"
-            if command.signature:
-                signature += f" {command.signature}"
+            signature = self.get_command_signature(command)
 
             # Truncate signature if too long
             if len(signature) > 256:  # Field name limit
@@ -171,26 +454,16 @@ class HelpCommand(commands.Cog):
 
     def create_command_embed(self, command: commands.Command) -> discord.Embed:
         """Create a detailed embed for a specific command"""
-        # Determine color based on command category
-        color = discord.Color.blue()
-        if command.cog_name == "Moderation":
-            color = discord.Color.red()
-        elif command.cog_name == "Admin":
-            color = discord.Color.orange()
-        elif command.cog_name == "Tasks":
-            color = discord.Color.purple()
-
         embed = EmbedBuilder.create_embed(
             title=f"Command: {command.qualified_name}",
             description=command.help or "No detailed description available.",
-            color=color,
+            # Determine color based on command category
+            color=_COG_COLORS.get(command.cog_name, _DEFAULT_COG_COLOR),
             timestamp=True,
         )
 
         # Command signature
-        signature = f"!{command.qualified_name}"
-        if command.signature:
-            signature += f" {command.signature}"
+        signature = self.get_command_signature(command)
 
         embed.add_field(name="📝 Usage", value=f"`{signature}`", inline=False)
 
@@ -200,20 +473,18 @@ class HelpCommand(commands.Cog):
             embed.add_field(name="🔄 Aliases", value=aliases, inline=True)
 
         # Required permissions
-        if hasattr(command, "checks") and command.checks:
-            perms = []
-            for check in command.checks:
-                if "admin" in str(check):
-                    perms.append("Administrator")
-                elif "mod" in str(check):
-                    perms.append("Moderator")
-
-            if perms:
-                embed.add_field(
-                    name="🔒 Required Permissions",
-                    value=", ".join(perms),
-                    inline=True,
-                )
+        # Checks from utils.checks carry a label for the permission they need
+        perms = [
+            check.permission_label
+            for check in command.checks
+            if hasattr(check, "permission_label")
+        ]
+        if perms:
+            embed.add_field(
+                name="🔒 Required Permissions",
+                value=", ".join(perms),
+                inline=True,
+            )
 
         # Category
         if command.cog_name:
@@ -227,15 +498,14 @@ class HelpCommand(commands.Cog):
     ):
         """Handle help category selection"""
         try:
-            categories = self.get_command_categories()
-
             if selected_value == "main":
                 embed = self.create_main_help_embed()
                 await interaction.response.edit_message(embed=embed)
-            elif selected_value in categories:
-                embed = self.create_category_embed(
-                    selected_value, categories[selected_value]
-                )
+                return
+
+            category = self.get_category(selected_value)
+            if category is not None:
+                embed = self.get_category_embed(category)
                 await interaction.response.edit_message(embed=embed)
             else:
                 embed = EmbedBuilder.create_error_embed(
@@ -272,56 +542,12 @@ class HelpCommand(commands.Cog):
                     await ctx.send("❌ No commands are currently available.")
                     return
 
-                # Create select options
-                options = [
-                    discord.SelectOption(
-                        label="Main Menu",
-                        value="main",
-                        description="Return to the main help menu",
-                        emoji="🏠",
-                    )
-                ]
-
-                for category_name in categories.keys():
-                    # Extract emoji from category name
-                    emoji = category_name.split()[0] if category_name else "📁"
-                    clean_name = (
-                        " ".join(category_name.split()[1:])
-                        if len(category_name.split()) > 1
-                        else category_name
-                    )
-
-                    # Ensure we have a valid clean name
-                    if not clean_name:
-                        clean_name = "Unknown"
-
-                    # Truncate label if too long (Discord limit is 100 chars)
-                    if len(clean_name) > 95:
-                        clean_name = clean_name[:92] + "..."
-
-                    # Truncate description if too long (Discord limit is 100 chars)
-                    description = f"View all {clean_name.lower()} commands"
-                    if len(description) > 95:
-                        description = description[:92] + "..."
-
-                    options.append(
-                        discord.SelectOption(
-                            label=clean_name,
-                            value=category_name,
-                            description=description,
-                            emoji=emoji,
-                        )
-                    )
-
                 # Ensure we have at least one option besides main menu
+                options = self.get_select_options()
                 if len(options) <= 1:
                     await ctx.send("❌ No command categories are currently available.")
                     return
 
-                # Limit to 25 options (Discord's limit)
-                if len(options) > 25:
-                    options = options[:25]
-
                 try:
                     await send_select_menu(
                         ctx,
@@ -338,10 +564,12 @@ class HelpCommand(commands.Cog):
                     await ctx.send(embed=embed)
 
             else:
+                lookup = command_or_category.lower()
+
                 # Look for specific command
-                command = self.bot.get_command(command_or_category.lower())
+                command = self.bot.get_command(lookup)
                 if command and not command.hidden:
-                    embed = self.create_command_embed(command)
+                    embed = self.get_command_embed(command)
                     try:
                         await ctx.send(embed=embed)
                     except discord.HTTPException as e:
@@ -352,32 +580,11 @@ class HelpCommand(commands.Cog):
                     return
 
                 # Look for category shortcuts
-                categories = self.get_command_categories()
-                category_shortcuts = {
-                    "mod": "🛡️ Moderation",
-                    "moderation": "🛡️ Moderation",
-                    "admin": "⚡ Admin",
-                    "administrator": "⚡ Admin",
-                    "task": "🔄 Tasks",
-                    "tasks": "🔄 Tasks",
-                    "db": "🗄️ Database",
-                    "database": "🗄️ Database",
-                    "util": "🔧 Utility",
-                    "utility": "🔧 Utility",
-                    "commands": "all",
-                }
-
-                lookup = command_or_category.lower()
-                if lookup in category_shortcuts:
-                    if category_shortcuts[lookup] == "all":
+                if lookup in _CATEGORY_SHORTCUTS:
+                    if _CATEGORY_SHORTCUTS[lookup] == "all":
                         # Show all commands in paginated format
-                        embeds = []
-                        for category_name, commands_list in categories.items():
-                            if commands_list:
-                                embed = self.create_category_embed(
-                                    category_name, commands_list
-                                )
-                                embeds.append(embed)
+                        categories = self.get_command_categories()
+                        embeds = self.get_all_commands_embeds(categories)
 
                         if embeds:
                             try:
@@ -385,8 +592,8 @@ class HelpCommand(commands.Cog):
                             except discord.HTTPException:
                                 # Fallback: send simple text list
                                 command_list = []
-                                for commands_list in categories.values():
-                                    for cmd in commands_list:
+                                for category in categories:
+                                    for cmd in category.commands:
                                         command_list.append(
                                             f"`!{cmd.qualified_name}` - {cmd.short_doc or 'No description'}"
                                         )
@@ -417,17 +624,16 @@ class HelpCommand(commands.Cog):
                         else:
                             await ctx.send("⚠️ No commands are currently available.")
                     else:
-                        category_name = category_shortcuts[lookup]
-                        if category_name in categories:
-                            embed = self.create_category_embed(
-                                category_name, categories[category_name]
-                            )
+                        category_name = _CATEGORY_SHORTCUTS[lookup]
+                        category = self.get_category(category_name)
+                        if category is not None:
+                            embed = self.get_category_embed(category)
                             try:
                                 await ctx.send(embed=embed)
                             except discord.HTTPException:
                                 # Fallback: send simple text list
                                 command_list = []
-                                for cmd in categories[category_name]:
+                                for cmd in category.commands:
                                     command_list.append(
                                         f"`!{cmd.qualified_name}` - {cmd.short_doc or 'No description'}"
                                     )
@@ -468,76 +674,62 @@ class HelpCommand(commands.Cog):
                     "❌ An error occurred while generating help information."
                 )
 
+    async def get_app_info(self) -> discord.AppInfo:
+        """Get the bot's application info, fetching it from Discord only once"""
+        if self._app_info is None:
+            self._app_info = await self.bot.application_info()
+        return self._app_info
+
+    def get_about_template(self) -> discord.Embed:
+        """Get the static part of the about embed, building it on first use"""
+        if self._about_template is None:
+            embed = EmbedBuilder.create_embed(
+                title="🤖 About This Bot",
+                description=_ABOUT_DESCRIPTION,
+                color=discord.Color.blue(),
+                thumbnail=self.bot.user.display_avatar.url if self.bot.user else None,
+            )
+
+            embed.add_field(
+                name="🐍 Python Version",
+                value=f"{self.bot.user.name} v1.0.0",
+                inline=True,
+            )
+
+            embed.add_field(
+                name="📚 discord.py Version", value=discord.__version__, inline=True
+            )
+
+            embed.add_field(
+                name="✨ Features", value=_ABOUT_FEATURES_VALUE, inline=True
+            )
+            embed.add_field(name="🔗 Links", value=_ABOUT_LINKS_VALUE, inline=True)
+
+            embed.set_footer(text="Made with ❤️ using discord.py")
+            self._about_template = embed
+
+        return self._about_template
+
     @commands.hybrid_command(name="about", aliases=["info", "botinfo"])
     async def about_command(self, ctx):
         """Show detailed information about the bot"""
-        embed = EmbedBuilder.create_embed(
-            title="🤖 About This Bot",
-            description=(
-                "A comprehensive Discord bot built with discord.py featuring "
-                "modular architecture, database integration, and modern UI components."
-            ),
-            color=discord.Color.blue(),
-            thumbnail=self.bot.user.display_avatar.url if self.bot.user else None,
-            timestamp=True,
-        )
+        embed = EmbedBuilder.clone_embed(self.get_about_template())
+        embed.timestamp = datetime.utcnow()
 
         # Bot information
-        app_info = await self.bot.application_info()
-        embed.add_field(name="👑 Bot Owner", value=app_info.owner.mention, inline=True)
-
-        embed.add_field(
-            name="🐍 Python Version",
-            value=f"{self.bot.user.name} v1.0.0",
-            inline=True,
-        )
-
-        embed.add_field(
-            name="📚 discord.py Version", value=discord.__version__, inline=True
+        app_info = await self.get_app_info()
+        embed.insert_field_at(
+            0, name="👑 Bot Owner", value=app_info.owner.mention, inline=True
         )
 
         # Statistics
-        guild_count = len(self.bot.guilds)
-        user_count = sum(guild.member_count or 0 for guild in self.bot.guilds)
-        command_count = len([cmd for cmd in self.bot.commands if not cmd.hidden])
-
-        embed.add_field(
+        embed.insert_field_at(
+            3,
             name="📊 Statistics",
-            value=(
-                f"**Servers:** {guild_count:,}\n"
-                f"**Users:** {user_count:,}\n"
-                f"**Commands:** {command_count}\n"
-                f"**Cogs:** {len(self.bot.cogs)}"
-            ),
-            inline=True,
-        )
-
-        # Features
-        features = [
-            "🛡️ Moderation Tools",
-            "⚡ Admin Commands",
-            "🔄 Background Tasks",
-            "🗄️ Database Integration",
-            "🌐 HTTP Session Management",
-            "📝 Comprehensive Logging",
-            "🎨 Interactive Menus",
-            "✅ Environment Validation",
-        ]
-
-        embed.add_field(name="✨ Features", value="\n".join(features), inline=True)
-
-        # Links
-        embed.add_field(
-            name="🔗 Links",
-            value=(
-                "[GitHub Repository](https://github.com/your-repo)\n"
-                "[Support Server](https://discord.gg/your-server)\n"
-                "[Invite Bot](https://discord.com/oauth2/authorize)"
-            ),
+            value=f"{self._build_stats_value()}\n**Cogs:** {len(self.bot.cogs)}",
             inline=True,
         )
 
-        embed.set_footer(text="Made with ❤️ using discord.py")
         await ctx.send(embed=embed)
 
 
@@ -1,12 +1,15 @@
 import discord
 from discord.ext import commands
 import asyncio
+import hashlib
+import json
 import os
 import logging
 import aiohttp
 from dotenv import load_dotenv
 from utils.database import DatabaseManager, SQLiteManager
 from utils.env_validator import validate_environment_or_exit
+from utils.outbox import DiscordOutbox
 
 # Load environment variables from .env file
 load_dotenv()
@@ -38,6 +41,12 @@ class DiscordBot(commands.Bot):
         # Database manager
         self.db = None
 
+        # Queue for message edits, coalesced and paced per channel
+        self.outbox = DiscordOutbox()
+
+        # Hash of the application command payloads last synced to Discord
+        self.synced_tree_hash = None
+
     async def setup_hook(self):
         """Called when the bot is starting up"""
         logger.info("Bot is starting up...")
@@ -97,6 +106,7 @@ class DiscordBot(commands.Bot):
             limit_per_host=30,  # Per-host connection limit
             ttl_dns_cache=300,  # DNS cache TTL
             use_dns_cache=True,
+            keepalive_timeout=75,  # Keep idle API connections open for reuse
         )
 
         timeout = aiohttp.ClientTimeout(total=30)  # 30 second timeout
@@ -122,6 +132,13 @@ class DiscordBot(commands.Bot):
             await self.db.close()
             logger.info("Database connection closed")
 
+    def command_tree_hash(self) -> str:
+        """Hash the global application command payloads that a sync would send"""
+        payload = [command.to_dict(self.tree) for command in self.tree.get_commands()]
+        return hashlib.blake2b(
+            json.dumps(payload, sort_keys=True).encode(), digest_size=16
+        ).hexdigest()
+
     async def on_ready(self):
         """Called when the bot is ready"""
         logger.info("%s has connected to Discord!", self.user)
@@ -135,10 +152,14 @@ class DiscordBot(commands.Bot):
             )
         )
 
-        # Sync slash commands automatically
+        # Sync slash commands automatically, skipping the request on reconnects
+        # when nothing has changed since the last sync
         try:
-            synced = await self.tree.sync()
-            logger.info("Synced %d slash commands", len(synced))
+            tree_hash = self.command_tree_hash()
+            if tree_hash != self.synced_tree_hash:
+                synced = await self.tree.sync()
+                self.synced_tree_hash = tree_hash
+                logger.info("Synced %d slash commands", len(synced))
         except Exception as e:
             logger.error("Failed to sync slash commands: %s", e)
 
@@ -149,6 +170,9 @@ class DiscordBot(commands.Bot):
         """Called when the bot is shutting down"""
         logger.info("Bot is shutting down...")
 
+        # Stop the message edit workers
+        await self.outbox.close()
+
         # Close database connection
         await self.close_database_connection()
 
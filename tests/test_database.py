@@ -0,0 +1,76 @@
+import os
+import random
+import unittest
+from unittest import mock
+
+from utils.database import DatabaseManager
+
+# PostgreSQL tests run against a scratch database given by TEST_DATABASE_*,
+# never the bot's own DATABASE_* settings
+_TEST_DB_ENV = {
+    "DATABASE_HOST": os.getenv("TEST_DATABASE_HOST"),
+    "DATABASE_PORT": os.getenv("TEST_DATABASE_PORT", "5432"),
+    "DATABASE_NAME": os.getenv("TEST_DATABASE_NAME"),
+    "DATABASE_USER": os.getenv("TEST_DATABASE_USER"),
+    "DATABASE_PASSWORD": os.getenv("TEST_DATABASE_PASSWORD"),
+    "DATABASE_SSL": os.getenv("TEST_DATABASE_SSL", "disable"),
+}
+
+
+@unittest.skipUnless(
+    all(_TEST_DB_ENV.values()),
+    "set TEST_DATABASE_HOST, _NAME, _USER and _PASSWORD to run PostgreSQL tests",
+)
+class PostgresUserDataTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.db = DatabaseManager()
+        with mock.patch.dict(os.environ, _TEST_DB_ENV):
+            await self.db.initialize()
+        self.user_id = random.randrange(10**15, 10**16)
+
+    async def asyncTearDown(self):
+        await self.db.execute("DELETE FROM user_data WHERE user_id = $1", self.user_id)
+        await self.db.execute("DELETE FROM bot_logs WHERE user_id = $1", self.user_id)
+        await self.db.close()
+
+    async def fetch_row(self):
+        return await self.db.fetchrow(
+            "SELECT guild_id, data FROM user_data WHERE user_id = $1", self.user_id
+        )
+
+    async def test_modify_keeps_keys_from_another_guild(self):
+        await self.db.execute(
+            "INSERT INTO user_data (user_id, guild_id, data) VALUES ($1, $2, $3)",
+            self.user_id,
+            111,
+            {"aura": {"amount": 500}, "extra": "kept"},
+        )
+
+        def mutator(data):
+            # The stored row belongs to guild 111, so this guild starts fresh
+            self.assertEqual(data, {})
+            data["aura"] = {"amount": 100}
+
+        await self.db.modify_users_data([(self.user_id, mutator)], guild_id=222)
+
+        row = await self.fetch_row()
+        self.assertEqual(row["guild_id"], 222)
+        self.assertEqual(row["data"], {"aura": {"amount": 100}, "extra": "kept"})
+
+    async def test_modify_creates_row_for_new_user(self):
+        def mutator(data):
+            data["aura"] = {"amount": 100}
+            return "test_action", {"amount": 100}
+
+        (result,) = await self.db.modify_users_data(
+            [(self.user_id, mutator)], guild_id=222
+        )
+
+        self.assertEqual(result, {"aura": {"amount": 100}})
+        row = await self.fetch_row()
+        self.assertEqual(row["guild_id"], 222)
+        self.assertEqual(row["data"], {"aura": {"amount": 100}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+import discord
+
+from utils.outbox import DiscordOutbox
+
+
+class FakeMessage:
+    """Stands in for discord.Message, recording every edit it receives"""
+
+    def __init__(self, message_id=1, channel_id=10, failures=()):
+        self.id = message_id
+        self.channel = SimpleNamespace(id=channel_id)
+        self.edits = []
+        # Exceptions raised by the first edit calls, in order
+        self.failures = list(failures)
+        self.block = None
+
+    async def edit(self, **kwargs):
+        self.edits.append(kwargs)
+        if self.block is not None:
+            await self.block.wait()
+        if self.failures:
+            raise self.failures.pop(0)
+        return self
+
+
+def http_429():
+    response = SimpleNamespace(status=429, reason="Too Many Requests")
+    return discord.HTTPException(response, "rate limited")
+
+
+class DiscordOutboxTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.outbox = DiscordOutbox(interval=0, backoff=0, idle_timeout=0.05)
+
+    async def asyncTearDown(self):
+        await self.outbox.close()
+
+    async def test_coalesces_pending_edits(self):
+        message = FakeMessage()
+
+        first = self.outbox.edit(message, content="first")
+        second = self.outbox.edit(message, content="second")
+
+        self.assertIs(first, second)
+        self.assertIs(await first, message)
+        self.assertEqual(message.edits, [{"content": "second"}])
+
+    async def test_retries_after_429(self):
+        message = FakeMessage(failures=[http_429(), discord.RateLimited(0)])
+
+        self.assertIs(await self.outbox.edit(message, content="x"), message)
+        self.assertEqual(len(message.edits), 3)
+
+    async def test_gives_up_after_max_retries(self):
+        self.outbox.max_retries = 1
+        message = FakeMessage(failures=[http_429(), http_429()])
+
+        with self.assertRaises(discord.HTTPException):
+            await self.outbox.edit(message, content="x")
+        self.assertEqual(len(message.edits), 2)
+
+    async def test_close_cancels_in_flight_and_queued_edits(self):
+        busy = FakeMessage(message_id=1)
+        busy.block = asyncio.Event()
+        queued = FakeMessage(message_id=2)
+
+        in_flight = self.outbox.edit(busy, content="busy")
+        waiting = self.outbox.edit(queued, content="queued")
+        while not busy.edits:
+            await asyncio.sleep(0)
+
+        await self.outbox.close()
+
+        self.assertTrue(in_flight.cancelled())
+        self.assertTrue(waiting.cancelled())
+        self.assertEqual(queued.edits, [])
+
+    async def test_idle_worker_exits(self):
+        message = FakeMessage()
+        await self.outbox.edit(message, content="x")
+
+        await asyncio.sleep(0.2)
+
+        self.assertNotIn(message.channel.id, self.outbox._workers)
+        self.assertNotIn(message.channel.id, self.outbox._queues)
+
+        # A later edit starts a fresh worker
+        self.assertIs(await self.outbox.edit(message, content="y"), message)
+
+
+if __name__ == "__main__":
+    unittest.main()
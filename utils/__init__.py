@@ -10,6 +10,7 @@ from .http_utils import (
     download_file,
     check_url,
 )
+from .cache import TTLCache
 from .database import (
     DatabaseManager,
     get_db,
@@ -24,6 +25,9 @@ from .env_validator import (
     validate_environment_or_exit,
     EnvironmentValidationError,
 )
+from .log import admin_logger
+from .log_buffer import LogBuffer
+from .outbox import DiscordOutbox
 from .menus import (
     MenuView,
     PaginatedEmbed,
@@ -49,6 +53,8 @@ __all__ = [
     "get_text",
     "download_file",
     "check_url",
+    # Caching
+    "TTLCache",
     # Database utilities
     "DatabaseManager",
     "get_db",
@@ -61,6 +67,11 @@ __all__ = [
     "validate_environment",
     "validate_environment_or_exit",
     "EnvironmentValidationError",
+    # Logging
+    "admin_logger",
+    "LogBuffer",
+    # Message outbox
+    "DiscordOutbox",
     # Menu utilities
     "MenuView",
     "PaginatedEmbed",
@@ -1,14 +1,34 @@
+import os
 import discord
 from discord.ext import commands
-from typing import Union
+from typing import FrozenSet, Optional, Union
+
+# Bot owner IDs from BOT_OWNER_IDS, loaded on the first admin check. .env is
+# only read at startup, so changing the owners takes a restart
+_owner_ids: Optional[FrozenSet[int]] = None
+
+
+def _load_owner_ids() -> FrozenSet[int]:
+    """Parse the comma-separated BOT_OWNER_IDS environment variable"""
+    raw = os.getenv("BOT_OWNER_IDS", "")
+    return frozenset(int(part) for part in raw.split(",") if part.strip().isdigit())
 
 
 def is_admin():
-    """Check if user has administrator permissions"""
+    """Check if user is a bot owner or has administrator permissions"""
 
     async def predicate(ctx):
+        global _owner_ids
+        if _owner_ids is None:
+            _owner_ids = _load_owner_ids()
+
+        # Owners skip the permission lookup entirely
+        if ctx.author.id in _owner_ids:
+            return True
+
         return ctx.author.guild_permissions.administrator
 
+    predicate.permission_label = "Administrator"
     return commands.check(predicate)
 
 
@@ -26,6 +46,7 @@ def is_mod_or_admin():
             ]
         )
 
+    predicate.permission_label = "Moderator"
     return commands.check(predicate)
 
 
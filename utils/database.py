@@ -5,32 +5,137 @@ import os
 import sqlite3
 import aiosqlite
 import json
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Union, Callable, Tuple
 from contextlib import asynccontextmanager
 
+from .cache import TTLCache
+from .log_buffer import LogBuffer
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+if orjson is not None:
+
+    def json_dumps(obj: Any) -> str:
+        """Serialize to a JSON string, using orjson when available"""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    # keep catching the stdlib exception
+    json_loads = orjson.loads
+else:
+
+    def json_dumps(obj: Any) -> str:
+        """Serialize to compact JSON, matching orjson's output"""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+    json_loads = json.loads
+
+# Guild prefixes are looked up for every message, so both managers keep a
+# short-lived copy; the TTL bounds staleness from writes by other processes
+PREFIX_CACHE_SIZE = 10_000
+PREFIX_CACHE_TTL = 300
+
+# PostgreSQL pool bounds. The pool keeps at least one connection per CPU
+# (minimum 4) open, capped at the maximum
+POOL_MAX_SIZE = 20
+POOL_MIN_SIZE = min(max(4, os.cpu_count() or 1), POOL_MAX_SIZE)
+
+# Mutates a user's data dict in place and optionally returns an
+# (action, details) pair to record in bot_logs
+UserDataMutator = Callable[[Dict[str, Any]], Optional[Tuple[str, Dict[str, Any]]]]
+
+
+# Applied to every SQLite connection. WAL (set once in initialize) makes
+# synchronous=NORMAL safe, dropping the fsync on every commit
+_SQLITE_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA foreign_keys=ON",
+)
+
 
 class SQLiteManager:
     """SQLite database manager as fallback when PostgreSQL is not available"""
 
-    def __init__(self, bot=None, db_path: str = "data/bot.db"):
+    def __init__(
+        self, bot=None, db_path: str = "data/bot.db", read_pool_size: int = None
+    ):
         self.bot = bot
         self.db_path = db_path
+        self.read_pool_size = read_pool_size or os.cpu_count() or 4
+        # One writer connection (SQLite allows a single writer at a time) and
+        # a pool of read-only connections that WAL lets run alongside it
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._write_lock = asyncio.Lock()
+        self._readers: Optional[asyncio.Queue] = None
+        self._prefix_cache = TTLCache(PREFIX_CACHE_SIZE, PREFIX_CACHE_TTL)
+        self._log_buffer = LogBuffer(self.log_actions)
         self._ensure_directory()
 
     def _ensure_directory(self):
         """Ensure the database directory exists"""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
 
+    async def _open_connection(self, read_only: bool = False) -> aiosqlite.Connection:
+        """Open a connection with the per-connection PRAGMAs applied"""
+        db = await aiosqlite.connect(self.db_path)
+        db.row_factory = aiosqlite.Row
+        for pragma in _SQLITE_CONNECTION_PRAGMAS:
+            await db.execute(pragma)
+        if read_only:
+            await db.execute("PRAGMA query_only=1")
+        return db
+
+    @asynccontextmanager
+    async def _write_connection(self):
+        """Hold the writer connection for the duration of the block"""
+        if self._writer is None:
+            raise RuntimeError("Database not initialized")
+
+        async with self._write_lock:
+            yield self._writer
+
+    @asynccontextmanager
+    async def _read_connection(self):
+        """Borrow a read-only connection from the pool"""
+        if self._readers is None:
+            raise RuntimeError("Database not initialized")
+
+        db = await self._readers.get()
+        try:
+            yield db
+        finally:
+            self._readers.put_nowait(db)
+
     async def initialize(self):
         """Initialize SQLite database"""
         try:
+            self._writer = await self._open_connection()
+
+            # WAL is stored in the database file, so it only needs setting once;
+            # readers then stop blocking behind writers
+            await self._writer.execute("PRAGMA journal_mode=WAL")
+
             # Create database file and tables
             await self._create_default_tables()
+
+            self._readers = asyncio.Queue()
+            for _ in range(self.read_pool_size):
+                self._readers.put_nowait(await self._open_connection(read_only=True))
+
+            self._log_buffer.start()
+
             logger.info("SQLite database initialized at %s", self.db_path)
         except Exception as e:
             logger.error("Failed to initialize SQLite database: %s", e)
+            await self.close()
             raise
 
     async def _create_default_tables(self):
@@ -84,46 +189,75 @@ class SQLiteManager:
         CREATE INDEX IF NOT EXISTS idx_bot_logs_created_at ON bot_logs(created_at);
         """
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._write_connection() as db:
             await db.executescript(create_tables_sql)
             await db.commit()
             logger.info("SQLite database tables created")
 
     async def close(self):
-        """Close database connections (no persistent connections in SQLite)"""
+        """Close the reader pool and the writer connection"""
+        # Write out buffered logs while the writer is still open
+        if self._writer is not None:
+            await self._log_buffer.close()
+
+        if self._readers is not None:
+            while not self._readers.empty():
+                await self._readers.get_nowait().close()
+            self._readers = None
+
+        if self._writer is not None:
+            await self._writer.close()
+            self._writer = None
+
         logger.info("SQLite database connections closed")
 
     # Utility methods for common operations
     async def execute(self, query: str, *args) -> str:
         """Execute a query that doesn't return data"""
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute(query, args)
-            await db.commit()
+        async with self._write_connection() as db:
+            try:
+                cursor = await db.execute(query, args)
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
             return f"Executed: {cursor.rowcount} rows affected"
 
     async def fetch(self, query: str, *args) -> List[Dict[str, Any]]:
         """Fetch multiple rows"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._read_connection() as db:
             cursor = await db.execute(query, args)
             rows = await cursor.fetchall()
             return [dict(row) for row in rows]
 
     async def fetchrow(self, query: str, *args) -> Optional[Dict[str, Any]]:
         """Fetch a single row"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._read_connection() as db:
             cursor = await db.execute(query, args)
             row = await cursor.fetchone()
             return dict(row) if row else None
 
     async def fetchval(self, query: str, *args) -> Any:
         """Fetch a single value"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._read_connection() as db:
             cursor = await db.execute(query, args)
             row = await cursor.fetchone()
             return row[0] if row else None
 
+    async def fetch_limited(
+        self, query: str, limit: int, *args
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Fetch at most limit rows, stepping the cursor no further than needed
+
+        Returns the rows and whether the query had more rows than that.
+        """
+        async with self._read_connection() as db:
+            cursor = await db.execute(query, args)
+            rows = await cursor.fetchmany(limit + 1)
+            await cursor.close()
+            return [dict(row) for row in rows[:limit]], len(rows) > limit
+
     # Guild settings methods
     async def get_guild_settings(self, guild_id: int) -> Dict[str, Any]:
         """Get guild settings"""
@@ -132,7 +266,7 @@ class SQLiteManager:
         )
         if row and row["settings"]:
             try:
-                return json.loads(row["settings"])
+                return json_loads(row["settings"])
             except json.JSONDecodeError:
                 return {}
         return {}
@@ -149,15 +283,21 @@ class SQLiteManager:
             VALUES (?, ?, CURRENT_TIMESTAMP)
             """,
             guild_id,
-            json.dumps(settings),
+            json_dumps(settings),
         )
+        # INSERT OR REPLACE rewrites the whole row, prefix column included
+        self.invalidate_prefix(guild_id)
 
     async def get_guild_prefix(self, guild_id: int) -> str:
         """Get guild command prefix"""
-        row = await self.fetchrow(
-            "SELECT prefix FROM guild_settings WHERE guild_id = ?", guild_id
-        )
-        return row["prefix"] if row else "!"
+        prefix = self._prefix_cache.get(guild_id)
+        if prefix is None:
+            row = await self.fetchrow(
+                "SELECT prefix FROM guild_settings WHERE guild_id = ?", guild_id
+            )
+            prefix = row["prefix"] if row else "!"
+            self._prefix_cache.set(guild_id, prefix)
+        return prefix
 
     async def set_guild_prefix(self, guild_id: int, prefix: str):
         """Set guild command prefix"""
@@ -169,6 +309,11 @@ class SQLiteManager:
             guild_id,
             prefix,
         )
+        self._prefix_cache.set(guild_id, prefix)
+
+    def invalidate_prefix(self, guild_id: int):
+        """Drop a guild's cached prefix so the next lookup reads the database"""
+        self._prefix_cache.pop(guild_id)
 
     # User data methods
     async def get_user_data(self, user_id: int, guild_id: int = None) -> Dict[str, Any]:
@@ -187,7 +332,7 @@ class SQLiteManager:
 
         if row and row["data"]:
             try:
-                return json.loads(row["data"])
+                return json_loads(row["data"])
             except json.JSONDecodeError:
                 return {}
         return {}
@@ -207,21 +352,100 @@ class SQLiteManager:
             """,
             user_id,
             guild_id,
-            json.dumps(existing_data),
+            json_dumps(existing_data),
         )
 
+    async def modify_users_data(
+        self, updates: List[Tuple[int, UserDataMutator]], guild_id: int = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Read, mutate and write user data for one or more users in a single
+        transaction, logging each change alongside it
+
+        Users are processed in user_id order; repeated user_ids see the result
+        of the earlier mutation. Returns the updated data in the order given.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(updates)
+        order = sorted(range(len(updates)), key=lambda i: updates[i][0])
+
+        async with self._write_connection() as db:
+            # Take the write lock up front so the reads can't go stale
+            await db.execute("BEGIN IMMEDIATE")
+            try:
+                for i in order:
+                    user_id, mutator = updates[i]
+                    if guild_id:
+                        cursor = await db.execute(
+                            "SELECT data FROM user_data WHERE user_id = ? AND guild_id = ?",
+                            (user_id, guild_id),
+                        )
+                    else:
+                        cursor = await db.execute(
+                            "SELECT data FROM user_data WHERE user_id = ? AND guild_id IS NULL",
+                            (user_id,),
+                        )
+                    row = await cursor.fetchone()
+
+                    data = {}
+                    if row and row[0]:
+                        try:
+                            data = json_loads(row[0])
+                        except json.JSONDecodeError:
+                            pass
+
+                    log_entry = mutator(data)
+
+                    await db.execute(
+                        """
+                        INSERT OR REPLACE INTO user_data (user_id, guild_id, data, updated_at) 
+                        VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                        """,
+                        (user_id, guild_id, json_dumps(data)),
+                    )
+                    if log_entry:
+                        action, details = log_entry
+                        await db.execute(
+                            "INSERT INTO bot_logs (guild_id, user_id, action, details) VALUES (?, ?, ?, ?)",
+                            (guild_id, user_id, action, json_dumps(details or {})),
+                        )
+                    results[i] = data
+
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+
+        return results
+
     # Logging methods
     async def log_action(
         self, guild_id: int, user_id: int, action: str, details: Dict[str, Any] = None
     ):
-        """Log a bot action"""
-        await self.execute(
-            "INSERT INTO bot_logs (guild_id, user_id, action, details) VALUES (?, ?, ?, ?)",
-            guild_id,
-            user_id,
-            action,
-            json.dumps(details or {}),
-        )
+        """
+        Log a bot action
+
+        The row is buffered and written with others in the next batch, so
+        this returns without waiting on the database.
+        """
+        self._log_buffer.put((guild_id, user_id, action, details))
+
+    async def log_actions(
+        self, entries: List[Tuple[int, int, str, Optional[Dict[str, Any]]]]
+    ):
+        """Log several (guild_id, user_id, action, details) rows in one commit"""
+        async with self._write_connection() as db:
+            try:
+                await db.executemany(
+                    "INSERT INTO bot_logs (guild_id, user_id, action, details) VALUES (?, ?, ?, ?)",
+                    [
+                        (guild_id, user_id, action, json_dumps(details or {}))
+                        for guild_id, user_id, action, details in entries
+                    ],
+                )
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
 
     async def get_recent_logs(
         self, guild_id: int, limit: int = 100
@@ -243,22 +467,22 @@ class SQLiteManager:
         self, task_name: str, is_running: bool, error: str = None
     ):
         """Update task status"""
-        # Get existing count
-        existing = await self.fetchrow(
-            "SELECT run_count FROM task_status WHERE task_name = ?", task_name
-        )
-        count = (existing["run_count"] if existing else 0) + 1
-
+        # Bump the run count in the same statement instead of reading it first
         await self.execute(
             """
-            INSERT OR REPLACE INTO task_status 
+            INSERT INTO task_status 
             (task_name, is_running, last_run, last_error, run_count, updated_at) 
-            VALUES (?, ?, CURRENT_TIMESTAMP, ?, ?, CURRENT_TIMESTAMP)
+            VALUES (?, ?, CURRENT_TIMESTAMP, ?, 1, CURRENT_TIMESTAMP)
+            ON CONFLICT (task_name) DO UPDATE SET
+                is_running = excluded.is_running,
+                last_run = CURRENT_TIMESTAMP,
+                last_error = excluded.last_error,
+                run_count = task_status.run_count + 1,
+                updated_at = CURRENT_TIMESTAMP
             """,
             task_name,
             int(is_running),
             error,
-            count,
         )
 
     async def get_task_status(self, task_name: str) -> Optional[Dict[str, Any]]:
@@ -279,6 +503,8 @@ class DatabaseManager:
         self.bot = bot
         self.pool: Optional[asyncpg.Pool] = None
         self._connection_config = {}
+        self._prefix_cache = TTLCache(PREFIX_CACHE_SIZE, PREFIX_CACHE_TTL)
+        self._log_buffer = LogBuffer(self.log_actions)
 
     async def initialize(self):
         """Initialize database connection pool"""
@@ -289,9 +515,13 @@ class DatabaseManager:
             # Create connection pool
             self.pool = await asyncpg.create_pool(
                 **self._connection_config,
-                min_size=2,  # Minimum connections in pool
-                max_size=10,  # Maximum connections in pool
+                # create_pool opens min_size connections up front, so early
+                # commands don't pay for TCP, TLS and auth handshakes
+                min_size=POOL_MIN_SIZE,
+                max_size=POOL_MAX_SIZE,
+                max_inactive_connection_lifetime=300,  # Recycle idle connections
                 command_timeout=30,  # Command timeout in seconds
+                init=self._init_connection,
                 server_settings={
                     "jit": "off",  # Disable JIT for better compatibility with pgbouncer
                     "application_name": "discord_bot",
@@ -303,14 +533,33 @@ class DatabaseManager:
                 version = await conn.fetchval("SELECT version()")
                 logger.info("Database connected successfully")
                 logger.info("PostgreSQL version: %s", version.split()[1])
+            logger.info(
+                "Connection pool warmed up: %d connections open (min %d, max %d)",
+                self.pool.get_size(),
+                self.pool.get_min_size(),
+                self.pool.get_max_size(),
+            )
 
             # Create default tables if they don't exist
             await self._create_default_tables()
 
+            self._log_buffer.start()
+
         except Exception as e:
             logger.error("Failed to initialize database: %s", e)
             raise
 
+    @staticmethod
+    async def _init_connection(conn: asyncpg.Connection):
+        """Encode and decode JSON columns with the shared (orjson) helpers"""
+        for json_type in ("json", "jsonb"):
+            await conn.set_type_codec(
+                json_type,
+                encoder=json_dumps,
+                decoder=json_loads,
+                schema="pg_catalog",
+            )
+
     def _load_config(self):
         """Load database configuration from environment variables"""
         # Required environment variables
@@ -323,6 +572,11 @@ class DatabaseManager:
         # Optional SSL configuration (recommended for Supabase)
         ssl = os.getenv("DATABASE_SSL", "require")
 
+        # asyncpg prepares each query once per connection and reuses the
+        # plan from this cache. Set to 0 behind pgbouncer in transaction
+        # mode, which can't keep prepared statements across transactions
+        statement_cache_size = int(os.getenv("DATABASE_STATEMENT_CACHE_SIZE", 256))
+
         if not all([host, database, user, password]):
             raise ValueError(
                 "Missing required database environment variables. Please check DATABASE_HOST, DATABASE_NAME, DATABASE_USER, and DATABASE_PASSWORD"
@@ -335,6 +589,7 @@ class DatabaseManager:
             "user": user,
             "password": password,
             "ssl": ssl,
+            "statement_cache_size": statement_cache_size,
         }
 
         logger.info(
@@ -396,6 +651,8 @@ class DatabaseManager:
     async def close(self):
         """Close database connection pool"""
         if self.pool:
+            # Write out buffered logs while the pool is still open
+            await self._log_buffer.close()
             await self.pool.close()
             logger.info("Database connection pool closed")
 
@@ -429,6 +686,22 @@ class DatabaseManager:
         async with self.acquire() as conn:
             return await conn.fetchval(query, *args)
 
+    async def fetch_limited(
+        self, query: str, limit: int, *args
+    ) -> Tuple[List[asyncpg.Record], bool]:
+        """
+        Fetch at most limit rows through a server-side cursor, so large
+        results are never pulled over in full
+
+        Returns the rows and whether the query had more rows than that.
+        """
+        async with self.acquire() as conn:
+            # Cursors only live inside a transaction
+            async with conn.transaction():
+                cursor = await conn.cursor(query, *args)
+                rows = await cursor.fetch(limit + 1)
+        return rows[:limit], len(rows) > limit
+
     # Guild settings methods
     async def get_guild_settings(self, guild_id: int) -> Dict[str, Any]:
         """Get guild settings"""
@@ -454,10 +727,14 @@ class DatabaseManager:
 
     async def get_guild_prefix(self, guild_id: int) -> str:
         """Get guild command prefix"""
-        row = await self.fetchrow(
-            "SELECT prefix FROM guild_settings WHERE guild_id = $1", guild_id
-        )
-        return row["prefix"] if row else "!"
+        prefix = self._prefix_cache.get(guild_id)
+        if prefix is None:
+            row = await self.fetchrow(
+                "SELECT prefix FROM guild_settings WHERE guild_id = $1", guild_id
+            )
+            prefix = row["prefix"] if row else "!"
+            self._prefix_cache.set(guild_id, prefix)
+        return prefix
 
     async def set_guild_prefix(self, guild_id: int, prefix: str):
         """Set guild command prefix"""
@@ -473,6 +750,11 @@ class DatabaseManager:
             guild_id,
             prefix,
         )
+        self._prefix_cache.set(guild_id, prefix)
+
+    def invalidate_prefix(self, guild_id: int):
+        """Drop a guild's cached prefix so the next lookup reads the database"""
+        self._prefix_cache.pop(guild_id)
 
     # User data methods
     async def get_user_data(self, user_id: int, guild_id: int = None) -> Dict[str, Any]:
@@ -507,18 +789,97 @@ class DatabaseManager:
             data,
         )
 
+    async def modify_users_data(
+        self, updates: List[Tuple[int, UserDataMutator]], guild_id: int = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Read, mutate and write user data for one or more users in a single
+        transaction, logging each change alongside it
+
+        Rows are locked in user_id order so concurrent transfers can't
+        deadlock; repeated user_ids see the result of the earlier mutation.
+        Returns the updated data in the order given.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(updates)
+        order = sorted(range(len(updates)), key=lambda i: updates[i][0])
+
+        async with self.acquire() as conn:
+            async with conn.transaction():
+                for i in order:
+                    user_id, mutator = updates[i]
+                    # FOR UPDATE only locks rows that exist, so create a first-
+                    # time user's row before reading; otherwise two concurrent
+                    # first mutations would both start from {}
+                    await conn.execute(
+                        """
+                        INSERT INTO user_data (user_id, guild_id)
+                        VALUES ($1, $2)
+                        ON CONFLICT (user_id) DO NOTHING
+                    """,
+                        user_id,
+                        guild_id,
+                    )
+                    row = await conn.fetchrow(
+                        "SELECT guild_id, data FROM user_data WHERE user_id = $1 FOR UPDATE",
+                        user_id,
+                    )
+                    data = {}
+                    if row["data"] and (not guild_id or row["guild_id"] == guild_id):
+                        data = dict(row["data"])
+
+                    log_entry = mutator(data)
+
+                    # Merge like set_user_data, so keys the mutator didn't see
+                    # (from a row stored under another guild) are kept
+                    await conn.execute(
+                        """
+                        UPDATE user_data
+                        SET data = COALESCE(user_data.data, '{}'::jsonb) || $2,
+                            guild_id = COALESCE($3, user_data.guild_id),
+                            updated_at = NOW()
+                        WHERE user_id = $1
+                    """,
+                        user_id,
+                        data,
+                        guild_id,
+                    )
+                    if log_entry:
+                        action, details = log_entry
+                        await conn.execute(
+                            "INSERT INTO bot_logs (guild_id, user_id, action, details) VALUES ($1, $2, $3, $4)",
+                            guild_id,
+                            user_id,
+                            action,
+                            details or {},
+                        )
+                    results[i] = data
+
+        return results
+
     # Logging methods
     async def log_action(
         self, guild_id: int, user_id: int, action: str, details: Dict[str, Any] = None
     ):
-        """Log a bot action"""
-        await self.execute(
-            "INSERT INTO bot_logs (guild_id, user_id, action, details) VALUES ($1, $2, $3, $4)",
-            guild_id,
-            user_id,
-            action,
-            details or {},
-        )
+        """
+        Log a bot action
+
+        The row is buffered and written with others in the next batch, so
+        this returns without waiting on the database.
+        """
+        self._log_buffer.put((guild_id, user_id, action, details))
+
+    async def log_actions(
+        self, entries: List[Tuple[int, int, str, Optional[Dict[str, Any]]]]
+    ):
+        """Log several (guild_id, user_id, action, details) rows in one commit"""
+        async with self.acquire() as conn:
+            await conn.executemany(
+                "INSERT INTO bot_logs (guild_id, user_id, action, details) VALUES ($1, $2, $3, $4)",
+                [
+                    (guild_id, user_id, action, details or {})
+                    for guild_id, user_id, action, details in entries
+                ],
+            )
 
     async def get_recent_logs(
         self, guild_id: int, limit: int = 100
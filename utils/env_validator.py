@@ -146,6 +146,19 @@ class EnvironmentValidator:
                     f"  Valid values: {', '.join(valid_ssl_modes)}"
                 )
 
+        # Validate DATABASE_STATEMENT_CACHE_SIZE if provided
+        cache_size = os.getenv("DATABASE_STATEMENT_CACHE_SIZE")
+        if cache_size:
+            try:
+                if int(cache_size) < 0:
+                    self.errors.append(
+                        f"DATABASE_STATEMENT_CACHE_SIZE must be 0 or more, got: {cache_size}"
+                    )
+            except ValueError:
+                self.errors.append(
+                    f"DATABASE_STATEMENT_CACHE_SIZE must be a number, got: {cache_size}"
+                )
+
     def _validate_optional_vars(self):
         """Validate other optional environment variables"""
         # Validate LOG_LEVEL if provided
@@ -158,6 +171,20 @@ class EnvironmentValidator:
                     f"  Valid values: {', '.join(valid_levels)}"
                 )
 
+        # Validate BOT_OWNER_IDS if provided
+        owner_ids = os.getenv("BOT_OWNER_IDS")
+        if owner_ids:
+            invalid_ids = [
+                part.strip()
+                for part in owner_ids.split(",")
+                if part.strip() and not part.strip().isdigit()
+            ]
+            if invalid_ids:
+                self.warnings.append(
+                    f"BOT_OWNER_IDS contains invalid user IDs: {', '.join(invalid_ids)}\n"
+                    "  Use a comma-separated list of numeric Discord user IDs"
+                )
+
         # Check for common .env file mistakes
         self._check_common_mistakes()
 
@@ -0,0 +1,7 @@
+# Shared loggers for the bot
+# Cogs are re-executed on every reload; resolving their loggers here means the
+# lookup through the logging manager happens once per process, not per reload
+
+import logging
+
+admin_logger = logging.getLogger("cogs.admin")
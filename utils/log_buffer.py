@@ -0,0 +1,74 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (guild_id, user_id, action, details)
+LogEntry = Tuple[Optional[int], Optional[int], str, Optional[Dict[str, Any]]]
+
+
+class LogBuffer:
+    """Buffers action log rows and writes them in batches
+
+    Rows are queued without touching the database and a background task
+    hands them to ``write`` every ``flush_interval`` seconds, at most
+    ``max_batch_size`` rows per call. When the queue is full, new rows are
+    dropped with a warning; the logs are audit-only and never worth
+    blocking a command for.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[List[LogEntry]], Awaitable[Any]],
+        *,
+        max_batch_size: int = 5000,
+        flush_interval: float = 1.0,
+        maxsize: int = 10_000,
+    ):
+        self.write = write
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._stopping = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the background flusher"""
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run())
+
+    def put(self, entry: LogEntry):
+        """Queue a log row for the next flush"""
+        try:
+            self._queue.put_nowait(entry)
+        except asyncio.QueueFull:
+            logger.warning("Log buffer full, dropping %s entry", entry[2])
+
+    async def _run(self):
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._stopping.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+
+    async def flush(self):
+        """Write everything queued so far, one batch at a time"""
+        while not self._queue.empty():
+            batch = []
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self.write(batch)
+            except Exception as e:
+                logger.error("Failed to write %d log entries: %s", len(batch), e)
+
+    async def close(self):
+        """Stop the flusher and write any rows still queued"""
+        if self._task is not None:
+            self._stopping.set()
+            await self._task
+            self._task = None
+        await self.flush()
@@ -2,6 +2,7 @@ import discord
 from discord.ext import commands
 from typing import List, Dict, Any, Optional, Callable, Union
 import asyncio
+import copy
 import logging
 from datetime import datetime
 
@@ -189,9 +190,36 @@ class ConfirmationMenu(MenuView):
         await interaction.response.defer()
 
 
+# Title prefix and base embed dict of each status embed. Status embeds are
+# built on hot paths such as every game result, so they come straight from
+# these dicts instead of going through create_embed.
+_STATUS_TEMPLATES = {
+    "error": ("❌", {"type": "rich", "color": discord.Color.red().value}),
+    "success": ("✅", {"type": "rich", "color": discord.Color.green().value}),
+    "warning": ("⚠️", {"type": "rich", "color": discord.Color.orange().value}),
+    "info": ("ℹ️", {"type": "rich", "color": discord.Color.blue().value}),
+}
+
+
 class EmbedBuilder:
     """Helper class for building beautiful embeds"""
 
+    @staticmethod
+    def _status_embed(
+        status: str, title: str, description: str, footer: Optional[str]
+    ) -> discord.Embed:
+        """Build a timestamped status embed from its template"""
+        prefix, template = _STATUS_TEMPLATES[status]
+        data = {
+            **template,
+            "title": f"{prefix} {title}",
+            "description": description,
+            "timestamp": discord.utils.utcnow().isoformat(),
+        }
+        if footer:
+            data["footer"] = {"text": footer}
+        return discord.Embed.from_dict(data)
+
     @staticmethod
     def create_embed(
         title: str = None,
@@ -202,17 +230,24 @@ class EmbedBuilder:
         thumbnail: str = None,
         image: str = None,
         footer: str = None,
-        timestamp: bool = False,
+        timestamp: Union[bool, datetime] = False,
     ) -> discord.Embed:
-        """Create a formatted embed with common styling"""
+        """Create a formatted embed with common styling
+
+        ``timestamp`` may be True for the current time, or a datetime to
+        share one timestamp between several embeds.
+        """
         if color is None:
             color = discord.Color.blue()
 
+        if timestamp is True:
+            timestamp = datetime.utcnow()
+
         embed = discord.Embed(
             title=title,
             description=description,
             color=color,
-            timestamp=datetime.utcnow() if timestamp else None,
+            timestamp=timestamp or None,
         )
 
         if author:
@@ -231,6 +266,15 @@ class EmbedBuilder:
 
         return embed
 
+    @staticmethod
+    def clone_embed(embed: discord.Embed) -> discord.Embed:
+        """Create an independent copy of an embed, including its fields
+
+        ``discord.Embed.copy`` shares the fields list with the original, so
+        adding fields to that copy would also modify a cached template.
+        """
+        return discord.Embed.from_dict(copy.deepcopy(embed.to_dict()))
+
     @staticmethod
     def create_error_embed(
         title: str = "Error",
@@ -239,13 +283,7 @@ class EmbedBuilder:
         footer: str = None,
     ) -> discord.Embed:
         """Create an error embed"""
-        return EmbedBuilder.create_embed(
-            title=f"❌ {title}",
-            description=description,
-            color=discord.Color.red(),
-            footer=footer,
-            timestamp=True,
-        )
+        return EmbedBuilder._status_embed("error", title, description, footer)
 
     @staticmethod
     def create_success_embed(
@@ -255,13 +293,7 @@ class EmbedBuilder:
         footer: str = None,
     ) -> discord.Embed:
         """Create a success embed"""
-        return EmbedBuilder.create_embed(
-            title=f"✅ {title}",
-            description=description,
-            color=discord.Color.green(),
-            footer=footer,
-            timestamp=True,
-        )
+        return EmbedBuilder._status_embed("success", title, description, footer)
 
     @staticmethod
     def create_warning_embed(
@@ -271,13 +303,7 @@ class EmbedBuilder:
         footer: str = None,
     ) -> discord.Embed:
         """Create a warning embed"""
-        return EmbedBuilder.create_embed(
-            title=f"⚠️ {title}",
-            description=description,
-            color=discord.Color.orange(),
-            footer=footer,
-            timestamp=True,
-        )
+        return EmbedBuilder._status_embed("warning", title, description, footer)
 
     @staticmethod
     def create_info_embed(
@@ -287,13 +313,7 @@ class EmbedBuilder:
         footer: str = None,
     ) -> discord.Embed:
         """Create an info embed"""
-        return EmbedBuilder.create_embed(
-            title=f"ℹ️ {title}",
-            description=description,
-            color=discord.Color.blue(),
-            footer=footer,
-            timestamp=True,
-        )
+        return EmbedBuilder._status_embed("info", title, description, footer)
 
 
 class LeaderboardBuilder:
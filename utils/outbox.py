@@ -0,0 +1,131 @@
+import asyncio
+import discord
+import logging
+from typing import Any, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class DiscordOutbox:
+    """Per-channel queue for message edits with coalescing and 429 backoff
+
+    Each channel gets its own worker that performs one edit at a time with a
+    short pause in between. Queuing another edit for a message that still has
+    one pending replaces the pending content, so a burst of updates becomes a
+    single API call carrying the newest state. A worker stops once its
+    channel has had nothing queued for ``idle_timeout`` seconds.
+    """
+
+    def __init__(
+        self,
+        *,
+        interval: float = 0.2,
+        max_retries: int = 3,
+        backoff: float = 1.0,
+        idle_timeout: float = 60.0,
+    ):
+        self.interval = interval
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.idle_timeout = idle_timeout
+        self._queues: Dict[int, asyncio.Queue] = {}
+        self._workers: Dict[int, asyncio.Task] = {}
+        # message id -> (message, latest edit kwargs, future shared by callers)
+        self._pending: Dict[
+            int, Tuple[discord.Message, Dict[str, Any], asyncio.Future]
+        ] = {}
+
+    def edit(self, message: discord.Message, **kwargs) -> asyncio.Future:
+        """
+        Queue an edit for a message
+
+        Returns a future resolving to the edited message. If an edit for the
+        same message is still waiting, its content is replaced and both
+        callers share the same future.
+        """
+        pending = self._pending.get(message.id)
+        if pending is not None:
+            _, _, future = pending
+            self._pending[message.id] = (message, kwargs, future)
+            return future
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[message.id] = (message, kwargs, future)
+        self._queue_for(message.channel.id).put_nowait(message.id)
+        return future
+
+    def _queue_for(self, channel_id: int) -> asyncio.Queue:
+        """Get the queue for a channel, starting its worker if needed"""
+        queue = self._queues.get(channel_id)
+        if queue is None:
+            queue = self._queues[channel_id] = asyncio.Queue()
+            self._workers[channel_id] = asyncio.create_task(
+                self._worker(channel_id, queue)
+            )
+        return queue
+
+    async def _worker(self, channel_id: int, queue: asyncio.Queue):
+        while True:
+            try:
+                message_id = await asyncio.wait_for(queue.get(), self.idle_timeout)
+            except asyncio.TimeoutError:
+                if not queue.empty():
+                    continue
+                # Idle channel: drop the worker, the next edit starts a new one
+                del self._queues[channel_id]
+                del self._workers[channel_id]
+                return
+
+            # Take the newest content at send time so later edits are folded in
+            message, kwargs, future = self._pending.pop(message_id)
+            try:
+                result = await self._edit_with_retry(message, kwargs)
+            except asyncio.CancelledError:
+                # The entry is no longer in _pending, so close() can't see it
+                future.cancel()
+                raise
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                queue.task_done()
+            await asyncio.sleep(self.interval)
+
+    async def _edit_with_retry(
+        self, message: discord.Message, kwargs: Dict[str, Any]
+    ) -> discord.Message:
+        """Edit a message, waiting out rate limits up to max_retries times"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await message.edit(**kwargs)
+            except discord.RateLimited as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = e.retry_after
+            except discord.HTTPException as e:
+                if e.status != 429 or attempt == self.max_retries:
+                    raise
+                delay = self.backoff * 2**attempt
+            logger.warning(
+                "Rate limited editing message %s, retrying in %.2fs",
+                message.id,
+                delay,
+            )
+            await asyncio.sleep(delay)
+
+    async def close(self):
+        """Stop all channel workers and cancel any edits still waiting"""
+        workers = list(self._workers.values())
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._workers.clear()
+        self._queues.clear()
+
+        for _, _, future in self._pending.values():
+            if not future.done():
+                future.cancel()
+        self._pending.clear()